@@ -17,11 +17,23 @@ Features:
 # Imports
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
 
+import functools
+import hashlib
 import json
+import mmap
 import os
 import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Type, TypeVar, Generic, Callable
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, Type, TypeVar, Generic, Callable
+
+try:
+    # Optional streaming parser for selective loading of large files
+    import ijson
+except ImportError:
+    ijson = None
 
 try:
     # Optional integration with module_base
@@ -42,6 +54,45 @@ ConfigDict = Dict[str, Any]
 # Type variable for config value
 T = TypeVar('T')
 
+# A single configuration change: (key, old value, new value)
+ConfigChange = Tuple[str, Any, Any]
+
+# Fingerprint of a loaded file:
+# (device, inode, mtime_ns or None, size, sha1 hex digest)
+FileFingerprint = Tuple[int, int, Optional[int], int, str]
+
+# Cached parse of a loaded file: (fingerprint, parsed config)
+FileCacheEntry = Tuple[FileFingerprint, ConfigDict]
+
+# Files modified more recently than this are always hashed on reload, since
+# a rewrite may not change the timestamp within filesystem granularity
+_RACY_WINDOW_NS = 2 * 1_000_000_000
+
+# Number of lookups after which a dotted key gets a compiled resolver
+_COMPILE_THRESHOLD = 64
+
+# Most dotted keys compiled automatically, and most distinct keys counted
+# toward compilation before the counts start afresh
+_MAX_COMPILED = 16
+_MAX_COUNTED = 1024
+
+# Marks a key missing from the configuration
+_MISSING = object()
+
+# Most distinct path strings kept by get_path before the cache starts afresh
+_MAX_PATH_OBJS = 256
+
+# Strings read as True by get_bool (compared lowercased)
+_TRUE_STRINGS = frozenset(('true', 'yes', '1', 'y'))
+
+# Boolean conversions keyed by exact value type
+_BOOL_CONVERTERS: Dict[type, Callable[[Any], bool]] = {
+    bool: bool,
+    int: bool,
+    float: bool,
+    str: lambda value: value.lower() in _TRUE_STRINGS,
+}
+
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
 # Configuration Manager
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
@@ -63,12 +114,19 @@ class ConfigManager:
         
         Args:
             config_file: Path to JSON configuration file (optional)
-            env_prefix: Prefix for environment variables (e.g., 'APP_')
+            env_prefix: Prefix for environment variables (e.g., 'APP_');
+                double underscores in names address nested keys
             default_config: Default configuration values
         """
         self.env_prefix = env_prefix
         self.config: ConfigDict = default_config or {}
         self.listeners: List[Callable[[str, Any], None]] = []
+        self.batch_listeners: List[Callable[[List[ConfigChange]], None]] = []
+        self._batch: Optional[List[ConfigChange]] = None
+        self._hits: Counter = Counter()
+        self._compiled: Dict[str, Callable[[ConfigDict], Any]] = {}
+        self._file_cache: Dict[str, FileCacheEntry] = {}
+        self._path_objs: Dict[str, Path] = {}
         
         # Load configuration file if provided
         if config_file:
@@ -77,22 +135,36 @@ class ConfigManager:
         # Apply environment variable overrides
         self._apply_env_overrides()
     
-    def load_config_file(self, config_file: Union[str, Path]) -> None:
+    def load_config_file(
+        self,
+        config_file: Union[str, Path],
+        only: Optional[Iterable[str]] = None
+    ) -> None:
         """
         Load configuration from a JSON file.
         
+        Reloading a file whose contents have not changed since it was last
+        loaded re-applies its previously parsed values without parsing it
+        again; use clear_file_cache() to force a re-read.
+        
         Args:
             config_file: Path to configuration file
+            only: Optional keys limiting which top-level sections are loaded;
+                dotted keys select their top-level section
             
         Raises:
             ConfigError: If file reading or parsing fails
         """
         try:
-            with open(config_file, 'r') as f:
-                file_config = json.load(f)
+            if only is None:
+                file_config = self._read_cached(config_file)
+            else:
+                file_config = self._load_sections(config_file, only)
                 
-            # Update configuration with file values
-            self._update_config(file_config)
+            # Update configuration with a fresh copy of the file values,
+            # interning keys so repeated lookups share one canonical string
+            # per key and later edits never reach the cached parse
+            self._update_config(_intern_keys(file_config))
             
         except FileNotFoundError:
             raise ConfigError(f"Configuration file not found: {config_file}")
@@ -101,6 +173,89 @@ class ConfigManager:
         except Exception as e:
             raise ConfigError(f"Error loading configuration: {e}")
     
+    def _read_cached(self, config_file: Union[str, Path]) -> ConfigDict:
+        """
+        Parse a JSON file, reusing the last parse if the file is unchanged.
+        
+        Files are cached by resolved path. The device, inode, modification
+        time and size are compared first. If any differ, the memory-mapped
+        contents are hashed and only parsed when the digest differs from the
+        one recorded at the last load.
+        
+        Args:
+            config_file: Path to configuration file
+            
+        Returns:
+            Parsed configuration; callers must copy it before modifying it
+        """
+        cache_key = os.path.realpath(config_file)
+        cached = self._file_cache.get(cache_key)
+        stat = os.stat(config_file)
+        
+        mtime: Optional[int] = stat.st_mtime_ns
+        if time.time_ns() - mtime < _RACY_WINDOW_NS:
+            mtime = None
+        
+        identity = (stat.st_dev, stat.st_ino, mtime, stat.st_size)
+        if cached and mtime is not None and cached[0][:4] == identity:
+            return cached[1]
+        
+        with open(config_file, 'rb') as f:
+            # Empty files cannot be memory-mapped
+            if stat.st_size:
+                contents = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                contents = b''
+            try:
+                digest = hashlib.sha1(contents).hexdigest()
+                unchanged = cached is not None and cached[0][4] == digest
+                data = None if unchanged else contents[:]
+            finally:
+                if isinstance(contents, mmap.mmap):
+                    contents.close()
+        
+        file_config = cached[1] if data is None else json.loads(data)
+        self._file_cache[cache_key] = (identity + (digest,), file_config)
+        return file_config
+    
+    def _load_sections(self, config_file: Union[str, Path], only: Iterable[str]) -> ConfigDict:
+        """
+        Load selected top-level sections from a JSON file.
+        
+        Uses the ijson streaming parser when available, so the whole document
+        is not held in memory at once. Each top-level value is still built in
+        full, but those outside the selected sections are dropped right after
+        they are parsed. Falls back to a full parse with the json module when
+        ijson is not installed or rejects the file (for example, the C backend
+        cannot represent integers wider than 64 bits).
+        
+        Args:
+            config_file: Path to configuration file
+            only: Keys selecting the sections to load
+            
+        Returns:
+            Dict containing only the selected sections
+        """
+        sections = {key.split('.', 1)[0] for key in only}
+        
+        if ijson is not None:
+            try:
+                with open(config_file, 'rb') as f:
+                    return {
+                        key: value
+                        for key, value in ijson.kvitems(f, '', use_float=True)
+                        if key in sections
+                    }
+            except Exception:
+                # Let the json module parse the file, so results and errors
+                # match an unfiltered load
+                pass
+        
+        # Fall back to a full parse and filter the result
+        with open(config_file, 'r') as f:
+            file_config = json.load(f)
+        return {key: value for key, value in file_config.items() if key in sections}
+    
     def _update_config(self, new_config: ConfigDict) -> None:
         """
         Update configuration with new values and notify listeners.
@@ -108,30 +263,68 @@ class ConfigManager:
         Args:
             new_config: New configuration values
         """
-        # Track changes for notifications
-        changes = {}
-        
-        # Update configuration
-        for key, value in new_config.items():
-            if key not in self.config or self.config[key] != value:
-                self.config[key] = value
-                changes[key] = value
+        with self.batch_updates():
+            for key, value in new_config.items():
+                if key not in self.config or self.config[key] != value:
+                    old_value = self.config.get(key)
+                    self.config[key] = value
+                    self._notify(key, old_value, value)
+    
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """
+        Group configuration changes and notify listeners once at the end.
         
-        # Notify listeners of changes
-        for key, value in changes.items():
+        Within the block, listeners are called once per changed key with its
+        final value, and batch listeners are called once with the full list of
+        changes. Nested batches are merged into the outermost one.
+        """
+        if self._batch is not None:
+            yield
+            return
+            
+        self._batch = []
+        try:
+            yield
+        finally:
+            changes, self._batch = self._batch, None
+            self._dispatch(changes)
+    
+    def _notify(self, key: str, old_value: Any, new_value: Any) -> None:
+        """Record a change in the active batch or dispatch it immediately."""
+        if self._batch is not None:
+            self._batch.append((key, old_value, new_value))
+        else:
+            self._dispatch([(key, old_value, new_value)])
+    
+    def _dispatch(self, changes: List[ConfigChange]) -> None:
+        """Notify listeners of a list of changes."""
+        if not changes:
+            return
+            
+        # Key listeners only see the final value of each changed key
+        latest = {key: new_value for key, _, new_value in changes}
+        for key, value in latest.items():
             for listener in self.listeners:
                 listener(key, value)
+                
+        for listener in self.batch_listeners:
+            listener(list(changes))
     
     def _apply_env_overrides(self) -> None:
         """Apply environment variable overrides to configuration."""
         if not self.env_prefix:
             return
             
+        prefix = self.env_prefix
+        prefix_len = len(prefix)
+        
         # Find environment variables with matching prefix
         for env_key, env_value in os.environ.items():
-            if env_key.startswith(self.env_prefix):
-                # Convert environment key to config key
-                config_key = env_key[len(self.env_prefix):].lower()
+            if env_key.startswith(prefix):
+                # Convert environment key to config key, with double
+                # underscores separating nested keys (APP_SERVER__PORT)
+                config_key = env_key[prefix_len:].lower().replace('__', '.')
                 
                 # Try to parse as JSON for structured values
                 try:
@@ -141,7 +334,7 @@ class ConfigManager:
                     value = env_value
                 
                 # Update configuration
-                self.config[config_key] = value
+                self.set(config_key, value)
     
     def get(self, key: str, default: T = None) -> Union[Any, T]:
         """
@@ -156,22 +349,68 @@ class ConfigManager:
         """
         # Handle nested keys using dot notation
         if '.' in key:
-            parts = key.split('.')
-            value = self.config
-            for part in parts:
-                if isinstance(value, dict) and part in value:
-                    value = value[part]
-                else:
+            # Frequently used keys are resolved by a compiled function
+            getter = self._compiled.get(key)
+            if getter is not None:
+                try:
+                    return getter(self.config)
+                except (LookupError, TypeError):
                     return default
+                    
+            value = self._lookup(key, _MISSING)
+            if value is _MISSING:
+                return default
+            if len(self._compiled) < _MAX_COMPILED:
+                self._count_lookup(key)
             return value
             
         return self.config.get(key, default)
     
+    def _lookup(self, key: str, default: Any = None) -> Any:
+        """Resolve a key by walking the configuration, without counting it."""
+        if '.' not in key:
+            return self.config.get(key, default)
+            
+        value = self.config
+        for part in key.split('.'):
+            if isinstance(value, dict) and part in value:
+                value = value[part]
+            else:
+                return default
+        return value
+    
+    def _count_lookup(self, key: str) -> None:
+        """Count a successful dotted lookup, compiling the key once it is hot."""
+        hits = self._hits
+        if key not in hits and len(hits) >= _MAX_COUNTED:
+            # Start counting afresh rather than growing without bound
+            hits.clear()
+        hits[key] += 1
+        if hits[key] >= _COMPILE_THRESHOLD:
+            del hits[key]
+            self._compiled[key] = _compile_getter(key.split('.'))
+    
+    def register_path(self, key: str) -> None:
+        """
+        Compile the resolver for a dotted key ahead of its first lookup.
+        
+        Keys read frequently are compiled automatically after repeated
+        lookups, up to a fixed number of keys; registering a known key skips
+        that warm-up and is not subject to the limit.
+        
+        Args:
+            key: Configuration key in dot notation
+        """
+        if '.' in key and key not in self._compiled:
+            self._compiled[key] = _compile_getter(key.split('.'))
+    
     def get_int(self, key: str, default: Optional[int] = None) -> Optional[int]:
         """Get configuration value as integer."""
         value = self.get(key, default)
         if value is None:
             return None
+        if type(value) is int:
+            return value
         try:
             return int(value)
         except (ValueError, TypeError):
@@ -182,6 +421,8 @@ class ConfigManager:
         value = self.get(key, default)
         if value is None:
             return None
+        if type(value) is float:
+            return value
         try:
             return float(value)
         except (ValueError, TypeError):
@@ -197,12 +438,13 @@ class ConfigManager:
         value = self.get(key, default)
         if value is None:
             return None
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, (int, float)):
-            return bool(value)
+        
+        # Dispatch on the exact type, falling back for subclasses
+        converter = _BOOL_CONVERTERS.get(type(value))
+        if converter is not None:
+            return converter(value)
         if isinstance(value, str):
-            return value.lower() in ('true', 'yes', '1', 'y')
+            return value.lower() in _TRUE_STRINGS
         return bool(value)
     
     def get_list(self, key: str, default: Optional[List[Any]] = None) -> Optional[List[Any]]:
@@ -240,6 +482,34 @@ class ConfigManager:
                 pass
         return default
     
+    def get_path(self, key: str, default: Optional[Path] = None) -> Optional[Path]:
+        """
+        Get configuration value as a Path.
+        
+        Path objects are cached by their string value, so repeated lookups
+        of an unchanged setting return the same object without re-parsing.
+        
+        Args:
+            key: Configuration key
+            default: Value returned when the key is not set or is not a path
+            
+        Returns:
+            Path for the configured value or default
+        """
+        value = self.get(key)
+        if not isinstance(value, (str, os.PathLike)):
+            return default
+        if not isinstance(value, str):
+            return Path(value)
+            
+        path = self._path_objs.get(value)
+        if path is None:
+            if len(self._path_objs) >= _MAX_PATH_OBJS:
+                # Start afresh rather than growing without bound
+                self._path_objs.clear()
+            path = self._path_objs[value] = Path(value)
+        return path
+    
     def set(self, key: str, value: Any) -> None:
         """
         Set configuration value.
@@ -248,9 +518,11 @@ class ConfigManager:
             key: Configuration key
             value: Configuration value
         """
+        old_value = self._lookup(key)
+        
         if '.' in key:
             # Handle nested keys
-            parts = key.split('.')
+            parts = [sys.intern(part) for part in key.split('.')]
             config = self.config
             
             # Navigate to the parent of the key
@@ -263,17 +535,26 @@ class ConfigManager:
             
             # Set the value at the leaf
             config[parts[-1]] = value
-            
-            # Notify listeners
-            for listener in self.listeners:
-                listener(key, value)
         else:
             # Simple key
-            self.config[key] = value
+            self.config[sys.intern(key)] = value
             
-            # Notify listeners
-            for listener in self.listeners:
-                listener(key, value)
+        # Notify listeners
+        self._notify(key, old_value, value)
+    
+    def update_many(self, values: Dict[str, Any]) -> None:
+        """
+        Set several configuration values at once.
+        
+        Listeners are notified once for the whole update, as with
+        batch_updates().
+        
+        Args:
+            values: Mapping of configuration keys (dot notation allowed) to values
+        """
+        with self.batch_updates():
+            for key, value in values.items():
+                self.set(key, value)
     
     def add_listener(self, listener: Callable[[str, Any], None]) -> None:
         """
@@ -295,6 +576,27 @@ class ConfigManager:
         if listener in self.listeners:
             self.listeners.remove(listener)
     
+    def add_batch_listener(self, listener: Callable[[List[ConfigChange]], None]) -> None:
+        """
+        Add a listener that receives lists of configuration changes.
+        
+        Args:
+            listener: Callback function that receives a list of
+                (key, old_value, new_value) tuples
+        """
+        if listener not in self.batch_listeners:
+            self.batch_listeners.append(listener)
+    
+    def remove_batch_listener(self, listener: Callable[[List[ConfigChange]], None]) -> None:
+        """
+        Remove a batch change listener.
+        
+        Args:
+            listener: Callback function to remove
+        """
+        if listener in self.batch_listeners:
+            self.batch_listeners.remove(listener)
+    
     def get_all(self) -> ConfigDict:
         """Get a copy of the entire configuration."""
         return dict(self.config)
@@ -302,6 +604,12 @@ class ConfigManager:
     def clear(self) -> None:
         """Clear all configuration values."""
         self.config.clear()
+        self._path_objs.clear()
+        self.clear_file_cache()
+    
+    def clear_file_cache(self) -> None:
+        """Forget cached file parses so the next load re-reads them."""
+        self._file_cache.clear()
     
     def save_to_file(self, filepath: Union[str, Path]) -> None:
         """
@@ -330,6 +638,8 @@ class ConfigValue(Generic[T]):
     This class provides type safety and validation for configuration values.
     """
     
+    __slots__ = ('config_manager', 'key', 'default', 'validator')
+    
     def __init__(
         self, 
         config_manager: ConfigManager,
@@ -384,6 +694,45 @@ class ConfigValue(Generic[T]):
 # Helper Functions
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
 
+def _compile_getter(parts: List[str]) -> Callable[[ConfigDict], Any]:
+    """
+    Compile a specialized resolver for a dotted configuration key.
+    
+    The generated function indexes the configuration directly, e.g.
+    ``c['database']['timeout']``, instead of walking the path in a loop.
+    
+    Args:
+        parts: Key path segments
+        
+    Returns:
+        Function taking the configuration dict and returning the value
+    """
+    source = "def getter(c):\n    return c" + "".join(f"[{part!r}]" for part in parts)
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<config {'.'.join(parts)}>", "exec"), namespace)
+    return namespace['getter']
+
+
+def _intern_keys(value: Any) -> Any:
+    """
+    Recursively intern the string keys of loaded configuration data.
+    
+    Args:
+        value: Parsed JSON value (dict, list or scalar)
+        
+    Returns:
+        Equivalent value whose dictionary keys are interned strings
+    """
+    if isinstance(value, dict):
+        return {
+            sys.intern(key) if isinstance(key, str) else key: _intern_keys(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_intern_keys(item) for item in value]
+    return value
+
+
 def create_config_manager(
     config_file: Optional[Union[str, Path]] = None,
     env_prefix: str = '',
@@ -412,6 +761,35 @@ def create_config_manager(
         return ConfigManager(default_config=default_config or {})
 
 
+# Configuration files already found, keyed by (file name, search paths)
+_found_config_files: Dict[Tuple[str, Tuple[str, ...]], Path] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _default_search_paths(cwd: str) -> Tuple[Path, ...]:
+    """
+    Build the default configuration search paths.
+    
+    Args:
+        cwd: Current working directory
+        
+    Returns:
+        Tuple of directories to search, in priority order
+    """
+    search_paths = [
+        Path(cwd),  # Current directory
+        Path.home(),  # User's home directory
+        Path('/etc'),  # System config directory
+    ]
+    
+    # Add application directory
+    app_dir = Path(sys.argv[0]).resolve().parent
+    if app_dir not in search_paths:
+        search_paths.insert(0, app_dir)
+        
+    return tuple(search_paths)
+
+
 def find_config_file(
     file_name: str = 'config.json',
     search_paths: Optional[List[Union[str, Path]]] = None
@@ -419,6 +797,9 @@ def find_config_file(
     """
     Find a configuration file in search paths.
     
+    A file found once is returned again for the same arguments as long as
+    it still exists; call find_config_file.cache_clear() to search afresh.
+    
     Args:
         file_name: Name of configuration file
         search_paths: List of paths to search (defaults to common locations)
@@ -427,27 +808,32 @@ def find_config_file(
         Path to configuration file or None if not found
     """
     if search_paths is None:
-        # Default search paths
-        search_paths = [
-            Path.cwd(),  # Current directory
-            Path.home(),  # User's home directory
-            Path('/etc'),  # System config directory
-        ]
-        
-        # Add application directory
-        app_dir = Path(sys.argv[0]).resolve().parent
-        if app_dir not in search_paths:
-            search_paths.insert(0, app_dir)
+        search_paths = _default_search_paths(os.getcwd())
+        
+    cache_key = (file_name, tuple(str(path) for path in search_paths))
+    cached = _found_config_files.get(cache_key)
+    if cached is not None and cached.is_file():
+        return cached
             
     # Search for the file
     for path in search_paths:
         config_path = Path(path) / file_name
         if config_path.is_file():
+            _found_config_files[cache_key] = config_path
             return config_path
             
     return None
 
 
+def _clear_config_file_cache() -> None:
+    """Forget found configuration files and default search paths."""
+    _found_config_files.clear()
+    _default_search_paths.cache_clear()
+
+
+find_config_file.cache_clear = _clear_config_file_cache
+
+
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
 # Example Usage
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
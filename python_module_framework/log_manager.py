@@ -28,9 +28,17 @@ import shutil
 import sys
 import time
 import traceback
-from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Set, Callable, TextIO
+from types import TracebackType
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, Set, Callable
+
+try:
+    # Optional fast serializer for JSON-format logs
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     # Optional integration with module_base
@@ -57,11 +65,28 @@ except ImportError:
             """Get default log level for this module."""
             return cls.INFO
 
+# Severity ordering used for level filtering
+_LEVEL_VALUES: Dict[str, int] = {
+    LogLevel.VERBOSE: 0,
+    LogLevel.INFO: 1,
+    LogLevel.WARNING: 2,
+    LogLevel.ERROR: 3
+}
+
+# Maximum number of queued events written together
+_BATCH_SIZE = 32
+
+# Log message text, or a callable producing it once the level is known to pass
+LogMessage = Union[str, Callable[[], str]]
+
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
 # Log Event Class
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
 
-@dataclass
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class LogEvent:
     """Container for log event data with metadata."""
     level: LogLevel
@@ -76,33 +101,48 @@ class LogEvent:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert log event to dictionary for structured logging."""
-        result = asdict(self)
-        result['level'] = self.level.value
-        result['timestamp_iso'] = datetime.datetime.fromtimestamp(
-            self.timestamp
-        ).isoformat()
-        return result
+        # Built by hand; asdict() recurses and deep-copies every field
+        return {
+            'level': self.level.value,
+            'message': self.message,
+            'timestamp': self.timestamp,
+            'service': self.service,
+            'component': self.component,
+            'module': self.module,
+            'function': self.function,
+            'thread_id': self.thread_id,
+            'context': dict(self.context),
+            'timestamp_iso': _iso_timestamp(self.timestamp),
+        }
     
     def to_str(self, fmt: str = None) -> str:
         """Format log event as string using format string."""
         if fmt is None:
             fmt = "[{timestamp}] [{service}] [{component}] [{level}] {message}"
             
-        # Default timestamp format
-        timestamp_str = datetime.datetime.fromtimestamp(
-            self.timestamp
-        ).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        
-        return fmt.format(
-            timestamp=timestamp_str,
-            service=self.service,
-            component=self.component,
-            module=self.module,
-            function=self.function,
-            level=self.level.value,
-            message=self.message,
-            **self.context
-        )
+        # Fields are looked up lazily, so only those in the format are built
+        return fmt.format_map(_EventFields(self))
+
+class _EventFields:
+    """Format field mapping for a log event that computes values on lookup."""
+    
+    __slots__ = ('event',)
+    
+    # Event attributes available to format strings as-is
+    _ATTRIBUTES = frozenset(('service', 'component', 'module', 'function', 'message'))
+    
+    def __init__(self, event: LogEvent):
+        self.event = event
+    
+    def __getitem__(self, key: str) -> Any:
+        event = self.event
+        if key == 'timestamp':
+            return _text_timestamp(event.timestamp)
+        if key == 'level':
+            return event.level.value
+        if key in self._ATTRIBUTES:
+            return getattr(event, key)
+        return event.context[key]
 
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
 # Exceptions
@@ -165,7 +205,8 @@ class LogManager:
             date_format: Format string for timestamps
         """
         self.service_name = service_name
-        self.log_level = LogLevel.from_string(log_level) if isinstance(log_level, str) else log_level
+        self.log_level = log_level
+        self._initial_log_level = self.log_level
         self.json_format = json_format
         self.console_output = console_output
         self.max_size = max_size
@@ -198,7 +239,19 @@ class LogManager:
         # Initialize worker tasks
         self._tasks: List[asyncio.Task] = []
         self._shutdown_flag = asyncio.Event()
-        self._file_handle: Optional[TextIO] = None
+        self._log_fd: Optional[int] = None
+        self._writer: Optional[ThreadPoolExecutor] = None
+    
+    @property
+    def log_level(self) -> LogLevel:
+        """Minimum log level to record."""
+        return self._log_level
+    
+    @log_level.setter
+    def log_level(self, value: Union[str, LogLevel]) -> None:
+        self._log_level = LogLevel.from_string(value) if isinstance(value, str) else value
+        # Cache the threshold so level checks are a single int comparison
+        self._log_level_value = _LEVEL_VALUES.get(self._log_level, 1)
     
     async def start(self) -> None:
         """Start log processing workers."""
@@ -209,11 +262,15 @@ class LogManager:
         # Open log file if needed
         if self.log_file:
             try:
-                self._file_handle = open(self.log_file, 'a', encoding='utf-8')
+                self._log_fd = self._open_log_file()
             except Exception as e:
                 raise LogFileError(f"Failed to open log file: {e}")
         
-        # Start worker tasks
+        # Start the output thread and worker tasks
+        self._writer = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=f"{self.service_name}-log-writer"
+        )
         self._tasks = [
             asyncio.create_task(self._process_high_priority()),
             asyncio.create_task(self._process_low_priority()),
@@ -253,58 +310,87 @@ class LogManager:
         except asyncio.CancelledError:
             pass
         
-        # Close file handle
-        if self._file_handle:
-            self._file_handle.close()
-            self._file_handle = None
+        # Let in-flight writes finish before closing the file
+        if self._writer:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+        
+        # Close log file
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
             
         # Clear task list
         self._tasks = []
     
+    async def drain(self) -> None:
+        """
+        Wait until all queued log events have been written.
+        
+        Returns immediately if the log manager has not been started.
+        """
+        if not self._tasks:
+            return
+        await self.high_priority_queue.join()
+        await self.low_priority_queue.join()
+    
+    def reset(self) -> None:
+        """
+        Return the log manager to a clean state without restarting it.
+        
+        Discards queued events, truncates the log file and restores the
+        log level given at construction, so one instance can be reused
+        across test cases.
+        """
+        for queue in (self.high_priority_queue, self.low_priority_queue):
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
+        
+        if self._log_fd is not None:
+            os.ftruncate(self._log_fd, 0)
+        elif self.log_file and self.log_file.exists():
+            open(self.log_file, 'w').close()
+        
+        self.log_level = self._initial_log_level
+    
     async def _process_high_priority(self) -> None:
         """Process high priority log events (WARNING, ERROR)."""
-        while not self._shutdown_flag.is_set():
-            try:
-                # Get next log event with timeout
-                log_event = await asyncio.wait_for(
-                    self.high_priority_queue.get(),
-                    timeout=0.5
-                )
-                
-                # Process event
-                await self._write_log_event(log_event)
-                
-                # Mark as done
-                self.high_priority_queue.task_done()
-                
-            except asyncio.TimeoutError:
-                # No new events, continue
-                continue
-            except asyncio.CancelledError:
-                # Task cancelled, exit
-                break
-            except Exception as e:
-                # Log processing error to stderr
-                print(f"Error processing high priority log: {e}", file=sys.stderr)
-                
-                # Sleep briefly to avoid tight loop
-                await asyncio.sleep(0.1)
+        await self._process_queue(self.high_priority_queue, "high")
     
     async def _process_low_priority(self) -> None:
         """Process low priority log events (INFO, VERBOSE)."""
+        await self._process_queue(self.low_priority_queue, "low")
+    
+    async def _process_queue(self, queue: asyncio.Queue, priority: str) -> None:
+        """
+        Process log events from a queue in batches.
+        
+        Waits for one event, then takes whatever is already queued (up to
+        _BATCH_SIZE events) so a burst is written with one call per output.
+        
+        Args:
+            queue: Queue to consume
+            priority: Queue name used in error messages
+        """
         while not self._shutdown_flag.is_set():
             try:
                 # Get next log event with timeout
-                log_event = await asyncio.wait_for(
-                    self.low_priority_queue.get(),
-                    timeout=0.5
-                )
+                batch = [await asyncio.wait_for(queue.get(), timeout=0.5)]
                 
-                # Process event
-                await self._write_log_event(log_event)
+                # Collect events queued behind it without waiting
+                try:
+                    while len(batch) < _BATCH_SIZE:
+                        batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    pass
                 
-                # Mark as done
-                self.low_priority_queue.task_done()
+                # Process events, always marking them done so drain() cannot hang
+                try:
+                    await self._write_log_events(batch)
+                finally:
+                    for _ in batch:
+                        queue.task_done()
                 
             except asyncio.TimeoutError:
                 # No new events, continue
@@ -314,7 +400,7 @@ class LogManager:
                 break
             except Exception as e:
                 # Log processing error to stderr
-                print(f"Error processing low priority log: {e}", file=sys.stderr)
+                print(f"Error processing {priority} priority log: {e}", file=sys.stderr)
                 
                 # Sleep briefly to avoid tight loop
                 await asyncio.sleep(0.1)
@@ -345,13 +431,18 @@ class LogManager:
                 await asyncio.sleep(1)
     
     async def _rotate_logs(self) -> None:
+        """Rotate log files on the writer thread."""
+        await self._run_writer(self._rotate_file)
+    
+    def _rotate_file(self) -> None:
         """Rotate log files."""
-        if not self.log_file or not self._file_handle:
+        if not self.log_file or self._log_fd is None:
             return
             
         try:
             # Close current file
-            self._file_handle.close()
+            os.close(self._log_fd)
+            self._log_fd = None
             
             # Rotate backup files
             for i in range(self.backup_count - 1, 0, -1):
@@ -374,14 +465,14 @@ class LogManager:
                 pass
                 
             # Reopen log file
-            self._file_handle = open(self.log_file, 'a', encoding='utf-8')
+            self._log_fd = self._open_log_file()
             
             # Log rotation message
             timestamp = datetime.datetime.now().strftime(self.date_format)
             rotation_message = f"[{timestamp}] [{self.service_name}] [log_manager] [INFO] Log file rotated"
             
             # Write to file directly
-            print(rotation_message, file=self._file_handle, flush=True)
+            self._write_file(rotation_message + '\n')
             
             # Write to console if enabled
             if self.console_output:
@@ -393,46 +484,86 @@ class LogManager:
             
             # Try to reopen log file
             try:
-                if not self._file_handle or self._file_handle.closed:
-                    self._file_handle = open(self.log_file, 'a', encoding='utf-8')
+                if self._log_fd is None:
+                    self._log_fd = self._open_log_file()
             except Exception as reopen_error:
                 print(f"Failed to reopen log file: {reopen_error}", file=sys.stderr)
     
+    def _open_log_file(self) -> int:
+        """Open the log file for appending and return its descriptor."""
+        return os.open(self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    
+    def _write_file(self, data: str) -> None:
+        """Write text straight to the log file descriptor, unbuffered."""
+        view = memoryview(data.encode('utf-8'))
+        while view:
+            view = view[os.write(self._log_fd, view):]
+    
     async def _write_log_event(self, event: LogEvent) -> None:
         """Write log event to configured outputs."""
+        await self._write_log_events([event])
+    
+    async def _write_log_events(self, events: List[LogEvent]) -> None:
+        """Write a batch of log events with a single write per output."""
+        lines = []
+        for event in events:
+            try:
+                # Format the log message
+                if self.json_format:
+                    lines.append(_dumps(event.to_dict()) + '\n')
+                else:
+                    lines.append(event.to_str(self.log_format) + '\n')
+                    # Text formats have no field for it, so add exception tracebacks below
+                    if 'traceback' in event.context:
+                        lines.append(event.context['traceback'])
+            except Exception as e:
+                # Skip only the event that failed to format
+                print(f"Error writing log event: {e}", file=sys.stderr)
+        
+        if not lines:
+            return
+        await self._run_writer(self._write_outputs, ''.join(lines))
+    
+    def _write_outputs(self, data: str) -> None:
+        """Write formatted log lines to the file and console outputs."""
         try:
-            # Format the log message
-            if self.json_format:
-                log_message = json.dumps(event.to_dict())
-            else:
-                log_message = event.to_str(self.log_format)
-                
             # Write to file if configured
-            if self._file_handle:
-                print(log_message, file=self._file_handle, flush=True)
+            if self._log_fd is not None:
+                self._write_file(data)
+                
+                # Rotate as soon as the file outgrows its limit
+                if os.fstat(self._log_fd).st_size > self.max_size:
+                    self._rotate_file()
                 
             # Write to console if enabled
             if self.console_output:
-                print(log_message, file=sys.stderr)
+                sys.stderr.write(data)
                 
         except Exception as e:
             # Last resort error logging
             print(f"Error writing log event: {e}", file=sys.stderr)
     
+    async def _run_writer(self, func: Callable[..., None], *args: Any) -> None:
+        """
+        Run a blocking output operation on the writer thread.
+        
+        All file and console I/O goes through one thread so writes and
+        rotation never interleave, and the event loop is not blocked.
+        Runs inline when the log manager has not been started.
+        """
+        if self._writer is None:
+            func(*args)
+            return
+        await asyncio.get_running_loop().run_in_executor(self._writer, func, *args)
+    
     def _should_log(self, level: LogLevel) -> bool:
         """Check if a log level should be logged."""
-        level_values = {
-            LogLevel.VERBOSE: 0,
-            LogLevel.INFO: 1,
-            LogLevel.WARNING: 2,
-            LogLevel.ERROR: 3
-        }
-        return level_values.get(level, 0) >= level_values.get(self.log_level, 1)
+        return _LEVEL_VALUES.get(level, 0) >= self._log_level_value
     
     async def log(
         self,
         level: LogLevel,
-        message: str,
+        message: LogMessage,
         component: str = "log_manager",
         context: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -441,13 +572,18 @@ class LogManager:
         
         Args:
             level: Log level
-            message: Log message
+            message: Log message, or a callable returning it that is only
+                invoked when the level is enabled
             component: Component name
             context: Additional context data
         """
         # Check log level first (optimization)
         if not self._should_log(level):
             return
+        
+        # Build deferred messages once, shared by all outputs
+        if callable(message):
+            message = message()
             
         # Get caller information
         frame = inspect.currentframe()
@@ -471,8 +607,55 @@ class LogManager:
             function=function,
             context=context or {}
         )
+        self._enqueue(event)
+    
+    async def log_many(
+        self,
+        level: LogLevel,
+        messages: Iterable[LogMessage],
+        component: str = "log_manager",
+        context: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Log several messages with the same level in one call.
         
-        # Determine queue based on priority
+        The level check and caller lookup are done once for the whole batch.
+        
+        Args:
+            level: Log level
+            messages: Log messages, or callables returning them
+            component: Component name
+            context: Additional context data shared by all messages
+        """
+        if not self._should_log(level):
+            return
+        
+        # Get caller information
+        frame = inspect.currentframe()
+        try:
+            frame = frame.f_back
+            module = frame.f_globals.get('__name__', 'unknown')
+            function = frame.f_code.co_name
+        except (AttributeError, KeyError):
+            module = 'unknown'
+            function = 'unknown'
+        finally:
+            del frame  # Avoid reference cycles
+        
+        for message in messages:
+            self._enqueue(LogEvent(
+                level=level,
+                message=message() if callable(message) else message,
+                service=self.service_name,
+                component=component,
+                module=module,
+                function=function,
+                context=context or {}
+            ))
+    
+    def _enqueue(self, event: LogEvent) -> None:
+        """Put a log event on the queue matching its priority."""
+        level = event.level
         if level in (LogLevel.ERROR, LogLevel.WARNING):
             # High priority logs
             try:
@@ -488,19 +671,23 @@ class LogManager:
                 # Drop low priority logs if queue is full
                 pass
     
-    async def verbose(self, message: str, component: str = "log_manager", context: Optional[Dict[str, Any]] = None) -> None:
+    async def verbose(self, message: LogMessage, component: str = "log_manager", context: Optional[Dict[str, Any]] = None) -> None:
         """Log at VERBOSE level."""
         await self.log(LogLevel.VERBOSE, message, component, context)
         
-    async def info(self, message: str, component: str = "log_manager", context: Optional[Dict[str, Any]] = None) -> None:
+    async def info(self, message: LogMessage, component: str = "log_manager", context: Optional[Dict[str, Any]] = None) -> None:
         """Log at INFO level."""
         await self.log(LogLevel.INFO, message, component, context)
         
-    async def warning(self, message: str, component: str = "log_manager", context: Optional[Dict[str, Any]] = None) -> None:
+    async def info_many(self, messages: Iterable[LogMessage], component: str = "log_manager", context: Optional[Dict[str, Any]] = None) -> None:
+        """Log several messages at INFO level."""
+        await self.log_many(LogLevel.INFO, messages, component, context)
+        
+    async def warning(self, message: LogMessage, component: str = "log_manager", context: Optional[Dict[str, Any]] = None) -> None:
         """Log at WARNING level."""
         await self.log(LogLevel.WARNING, message, component, context)
         
-    async def error(self, message: str, component: str = "log_manager", context: Optional[Dict[str, Any]] = None) -> None:
+    async def error(self, message: LogMessage, component: str = "log_manager", context: Optional[Dict[str, Any]] = None) -> None:
         """Log at ERROR level."""
         await self.log(LogLevel.ERROR, message, component, context)
     
@@ -512,8 +699,7 @@ class LogManager:
             message = f"{message}: {str(exc)}"
             
         # Get traceback
-        tb = traceback.format_exception(type(exc), exc, exc.__traceback__)
-        tb_str = ''.join(tb)
+        tb_str = _format_traceback(exc, exc.__traceback__)
         
         # Log with exception details
         context = {
@@ -541,26 +727,26 @@ class ComponentLogger:
         self.log_manager = log_manager
         self.component_name = component_name
     
-    async def log(self, level: LogLevel, message: str, context: Optional[Dict[str, Any]] = None) -> None:
+    async def log(self, level: LogLevel, message: LogMessage, context: Optional[Dict[str, Any]] = None) -> None:
         """Log at the specified level."""
         await self.log_manager.log(level, message, self.component_name, context)
         
-    async def verbose(self, message: str, context: Optional[Dict[str, Any]] = None) -> None:
+    async def verbose(self, message: LogMessage, context: Optional[Dict[str, Any]] = None) -> None:
         """Log at VERBOSE level."""
         if self.log_manager._should_log(LogLevel.VERBOSE):
             await self.log(LogLevel.VERBOSE, message, context)
         
-    async def info(self, message: str, context: Optional[Dict[str, Any]] = None) -> None:
+    async def info(self, message: LogMessage, context: Optional[Dict[str, Any]] = None) -> None:
         """Log at INFO level."""
         if self.log_manager._should_log(LogLevel.INFO):
             await self.log(LogLevel.INFO, message, context)
         
-    async def warning(self, message: str, context: Optional[Dict[str, Any]] = None) -> None:
+    async def warning(self, message: LogMessage, context: Optional[Dict[str, Any]] = None) -> None:
         """Log at WARNING level."""
         if self.log_manager._should_log(LogLevel.WARNING):
             await self.log(LogLevel.WARNING, message, context)
         
-    async def error(self, message: str, context: Optional[Dict[str, Any]] = None) -> None:
+    async def error(self, message: LogMessage, context: Optional[Dict[str, Any]] = None) -> None:
         """Log at ERROR level."""
         if self.log_manager._should_log(LogLevel.ERROR):
             await self.log(LogLevel.ERROR, message, context)
@@ -577,6 +763,65 @@ class ComponentLogger:
 # Helper Functions
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
 
+# Last formatted timestamp for each format; events in a burst often share one
+_iso_cache: Tuple[Optional[float], str] = (None, '')
+_text_cache: Tuple[Optional[float], str] = (None, '')
+
+def _iso_timestamp(timestamp: float) -> str:
+    """Format a timestamp as ISO 8601, reusing the previous result if unchanged."""
+    global _iso_cache
+    cached_timestamp, formatted = _iso_cache
+    if timestamp != cached_timestamp:
+        formatted = datetime.datetime.fromtimestamp(timestamp).isoformat()
+        _iso_cache = (timestamp, formatted)
+    return formatted
+
+def _text_timestamp(timestamp: float) -> str:
+    """Format a timestamp for text logs, reusing the previous result if unchanged."""
+    global _text_cache
+    cached_timestamp, formatted = _text_cache
+    if timestamp != cached_timestamp:
+        formatted = datetime.datetime.fromtimestamp(
+            timestamp
+        ).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        _text_cache = (timestamp, formatted)
+    return formatted
+
+# Recently formatted tracebacks keyed by id(exception), holding the
+# traceback each was formatted from so a reused id is never mistaken for it
+_TRACEBACK_CACHE_SIZE = 8
+_traceback_cache: Dict[int, Tuple[Optional[TracebackType], str]] = {}
+
+def _format_traceback(exc: BaseException, tb: Optional[TracebackType]) -> str:
+    """
+    Format an exception with its traceback.
+    
+    Logging the same exception again reuses the formatted text, while a
+    re-raise (new traceback) does not. The exception itself is left
+    untouched and need not be hashable.
+    """
+    key = id(exc)
+    cached = _traceback_cache.get(key)
+    if cached is not None and cached[0] is tb:
+        return cached[1]
+    
+    formatted = ''.join(traceback.format_exception(type(exc), exc, tb))
+    if key not in _traceback_cache and len(_traceback_cache) >= _TRACEBACK_CACHE_SIZE:
+        # Evict the oldest entry
+        del _traceback_cache[next(iter(_traceback_cache))]
+    _traceback_cache[key] = (tb, formatted)
+    return formatted
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log record to a JSON string, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            # Values orjson rejects (e.g. integers over 64 bits) go to json
+            pass
+    return json.dumps(data)
+
 def create_log_manager(
     service_name: str = "service",
     log_level: Union[str, LogLevel] = LogLevel.INFO,
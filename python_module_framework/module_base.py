@@ -21,6 +21,7 @@ Features:
 
 import asyncio
 import enum
+import functools
 import inspect
 import json
 import os
@@ -29,7 +30,7 @@ import sys
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, List, Callable, Type, TypeVar, Set
+from typing import Any, Awaitable, Dict, Iterable, Optional, Sequence, Union, List, Callable, Type, TypeVar, Set
 from typing import Pattern, get_type_hints, cast, Generator
 
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
@@ -63,6 +64,17 @@ ValidatorType = Callable[[Any], bool]
 # Validators
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
 
+# Patterns for the fixed string validators, compiled once at import
+_IP_ADDRESS_PATTERN = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
+_HOSTNAME_PATTERN = re.compile(r'^(([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9])\.)*([A-Za-z0-9]|[A-Za-z0-9][A-Za-z0-9\-]*[A-Za-z0-9])$')
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_PATTERN = re.compile(r'^(http|https)://[a-zA-Z0-9]+([\-\.]{1}[a-zA-Z0-9]+)*\.[a-zA-Z]{2,5}(:[0-9]{1,5})?(\/.*)?$')
+
+@functools.lru_cache(maxsize=None)
+def _compile_pattern(pattern: str) -> Pattern:
+    """Compile a regex pattern once per distinct pattern string."""
+    return re.compile(pattern)
+
 class Validator:
     """Helper class with common validators for configuration parameters."""
     
@@ -95,7 +107,7 @@ class Validator:
     def matches(pattern: Union[str, Pattern]) -> ValidatorType:
         """Create a validator that checks if a string matches a regex pattern."""
         if isinstance(pattern, str):
-            compiled_pattern = re.compile(pattern)
+            compiled_pattern = _compile_pattern(pattern)
         else:
             compiled_pattern = pattern
             
@@ -105,8 +117,7 @@ class Validator:
     @staticmethod
     def ip_address(value: str) -> bool:
         """Validate that a string is an IP address."""
-        pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-        if not re.match(pattern, value):
+        if not _IP_ADDRESS_PATTERN.match(value):
             return False
             
         # Check each octet is in valid range
@@ -120,20 +131,17 @@ class Validator:
     def hostname(value: str) -> bool:
         """Validate that a string is a valid hostname."""
         # Simple hostname validation - RFC 1123
-        pattern = r'^(([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9])\.)*([A-Za-z0-9]|[A-Za-z0-9][A-Za-z0-9\-]*[A-Za-z0-9])$'
-        return isinstance(value, str) and re.match(pattern, value) is not None
+        return isinstance(value, str) and _HOSTNAME_PATTERN.match(value) is not None
     
     @staticmethod
     def email(value: str) -> bool:
         """Validate that a string is an email address."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return isinstance(value, str) and re.match(pattern, value) is not None
+        return isinstance(value, str) and _EMAIL_PATTERN.match(value) is not None
     
     @staticmethod
     def url(value: str) -> bool:
         """Validate that a string is a URL."""
-        pattern = r'^(http|https)://[a-zA-Z0-9]+([\-\.]{1}[a-zA-Z0-9]+)*\.[a-zA-Z]{2,5}(:[0-9]{1,5})?(\/.*)?$'
-        return isinstance(value, str) and re.match(pattern, value) is not None
+        return isinstance(value, str) and _URL_PATTERN.match(value) is not None
     
     @staticmethod
     def length(min_len: int = 0, max_len: Optional[int] = None) -> ValidatorType:
@@ -349,8 +357,11 @@ class BaseModule:
     """
     
     # Modules must override these with their own declarations
-    CONFIG_PARAMS: List[ConfigParam] = []
-    DEPENDENCIES: List[Dependency] = []
+    CONFIG_PARAMS: Sequence[ConfigParam] = ()
+    DEPENDENCIES: Sequence[Dependency] = ()
+    
+    # Set True to initialize and clean up components concurrently
+    CONCURRENT_LIFECYCLE: bool = False
     
     def __init__(
         self, 
@@ -435,9 +446,6 @@ class BaseModule:
         result = {}
         config_dict = {}  # Normalized config values
         
-        # Build default config from declarations
-        param_map = {param.name: param for param in self.CONFIG_PARAMS}
-        
         # Extract existing config
         if config is None:
             # Use defaults only
@@ -521,8 +529,14 @@ class BaseModule:
                     await self._log(LogLevel.VERBOSE, f"  {line}")
         
         # Initialize components
-        for name, component in self.components.items():
-            if hasattr(component, 'init') and callable(component.init):
+        components = [
+            component for component in self.components.values()
+            if hasattr(component, 'init') and callable(component.init)
+        ]
+        if self.CONCURRENT_LIFECYCLE:
+            await _gather_settled(component.init() for component in components)
+        else:
+            for component in components:
                 await component.init()
     
     async def run(self):
@@ -582,12 +596,24 @@ class BaseModule:
         await self._log(LogLevel.INFO, f"Cleaning up {self.module_name}")
         
         # Clean up components in reverse order
-        for name, component in reversed(list(self.components.items())):
-            if hasattr(component, 'cleanup') and callable(component.cleanup):
-                try:
-                    await component.cleanup()
-                except Exception as e:
-                    await self._log(LogLevel.ERROR, f"Error cleaning up component {name}: {e}")
+        components = [
+            (name, component) for name, component in reversed(list(self.components.items()))
+            if hasattr(component, 'cleanup') and callable(component.cleanup)
+        ]
+        if self.CONCURRENT_LIFECYCLE:
+            await _gather_settled(
+                self._cleanup_component(name, component) for name, component in components
+            )
+        else:
+            for name, component in components:
+                await self._cleanup_component(name, component)
+    
+    async def _cleanup_component(self, name: str, component: Any):
+        """Clean up one component, logging rather than raising errors."""
+        try:
+            await component.cleanup()
+        except Exception as e:
+            await self._log(LogLevel.ERROR, f"Error cleaning up component {name}: {e}")
 
     def get_uptime(self) -> float:
         """Get module uptime in seconds."""
@@ -660,6 +686,21 @@ class BaseComponent:
 
 T = TypeVar('T', bound=BaseModule)
 
+async def _gather_settled(awaitables: Iterable[Awaitable[Any]]) -> None:
+    """
+    Run awaitables concurrently and wait for all of them to finish.
+    
+    Unlike a plain gather, a failure does not leave the others running
+    unawaited; the first error is re-raised once every awaitable has settled.
+    
+    Args:
+        awaitables: Awaitables to run
+    """
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
 async def run_module(module_class: Type[T], *args, **kwargs) -> T:
     """
     Helper to run a module's full lifecycle.
@@ -34,12 +34,15 @@ setup(
     ],
     extras_require={
         "system": ["psutil>=5.9.0"],
+        "streaming": ["ijson>=3.1.0"],
+        "json": ["orjson>=3.6.0"],
         "dev": [
             "black>=23.1.0",
             "isort>=5.12.0",
             "pylint>=2.16.0",
             "pytest>=7.2.0",
-            "pytest-asyncio>=0.20.0",
+            "pytest-asyncio>=0.26.0",
+            "pytest-xdist>=3.0.0",
             "coverage>=7.1.0",
         ],
     },
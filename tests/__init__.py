@@ -8,22 +8,16 @@ This package contains tests for all components of the framework:
 """
 
 # Import test modules to make them discoverable
-from .test_module_base import TestLogLevel, TestConfigParam, TestDependencyClass
-from .test_module_base import TestBaseModule, TestBaseComponent, TestValidators, TestHelperFunctions
+from . import test_module_base
 
 from .test_log_manager import TestLogEvent, TestLogManager, TestComponentLogger, TestHelperFunctions as LogHelperFunctions
 
-from .test_config_manager import TestConfigManager, TestConfigValue, TestHelperFunctions as ConfigHelperFunctions
+from .test_config_manager import TestConfigManager
 
 # Define what's available via import *
 __all__ = [
-    # module_base tests
-    "TestLogLevel",
-    "TestConfigParam", 
-    "TestDependencyClass", 
-    "TestBaseModule", 
-    "TestBaseComponent", 
-    "TestValidators",
+    # module_base tests (module-level test functions)
+    "test_module_base",
     
     # log_manager tests
     "TestLogEvent",
@@ -32,5 +26,4 @@ __all__ = [
     
     # config_manager tests
     "TestConfigManager",
-    "TestConfigValue"
 ]
\ No newline at end of file
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Shared pytest configuration for the framework tests.
+
+Tests marked as slow are skipped unless --run-slow is given.
+"""
+
+import pytest
+
+def pytest_addoption(parser):
+    """Add the --run-slow command line option."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow"
+    )
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless they were requested."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -11,30 +11,27 @@ These tests verify the proper operation of:
 """
 
 import asyncio
+import contextlib
+import io
 import json
 import os
-import sys
-import tempfile
+import pickle
+import threading
 from datetime import datetime
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
-# Add parent directory to sys.path to allow importing the framework
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-try:
-    from python_module_framework import (
-        LogManager, ComponentLogger, LogLevel, LogEvent, LoggingError,
-        create_log_manager, get_component_logger
-    )
-except ImportError:
-    # Try direct import for development
-    from log_manager import (
-        LogManager, ComponentLogger, LogLevel, LogEvent, LoggingError,
-        create_log_manager, get_component_logger
-    )
+from python_module_framework.log_manager import (
+    LogManager,
+    ComponentLogger,
+    LogLevel,
+    LogEvent,
+    LoggingError,
+    create_log_manager,
+    get_component_logger,
+)
 
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
 # Test Classes & Fixtures
@@ -43,47 +40,30 @@ except ImportError:
 class CaptureOutput:
     """Context manager for capturing stdout/stderr for testing."""
     
+    __slots__ = ('stream', '_buffer', '_redirect')
+    
     def __init__(self, stream='stderr'):
         self.stream = stream
-        self.captured_output = []
-        self._original_write = None
-        self._original_stream = None
+        self._buffer = io.StringIO()
+        if stream == 'stdout':
+            self._redirect = contextlib.redirect_stdout(self._buffer)
+        else:
+            self._redirect = contextlib.redirect_stderr(self._buffer)
     
     def __enter__(self):
-        if self.stream == 'stdout':
-            self._original_stream = sys.stdout
-            self._original_write = sys.stdout.write
-        else:
-            self._original_stream = sys.stderr
-            self._original_write = sys.stderr.write
-            
-        def capture_write(text):
-            self.captured_output.append(text)
-            return len(text)
-            
-        if self.stream == 'stdout':
-            sys.stdout.write = capture_write
-        else:
-            sys.stderr.write = capture_write
-            
+        self._redirect.__enter__()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.stream == 'stdout':
-            sys.stdout.write = self._original_write
-            sys.stdout = self._original_stream
-        else:
-            sys.stderr.write = self._original_write
-            sys.stderr = self._original_stream
+        return self._redirect.__exit__(exc_type, exc_val, exc_tb)
     
     def get_output(self):
-        return ''.join(self.captured_output)
+        return self._buffer.getvalue()
 
-@pytest.fixture
-def temp_log_dir():
-    """Create a temporary directory for log files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+@pytest.fixture(scope="module")
+def temp_log_dir(tmp_path_factory):
+    """Create a temporary directory for log files shared by the module."""
+    return tmp_path_factory.mktemp("logs")
 
 @pytest.fixture
 async def log_manager(temp_log_dir):
@@ -105,7 +85,8 @@ async def log_manager(temp_log_dir):
     
     yield manager
     
-    # Stop manager
+    # Leave the shared log file empty for the next test, then stop
+    manager.reset()
     await manager.stop()
 
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
@@ -170,6 +151,16 @@ class TestLogEvent:
         assert event_dict["timestamp"] == timestamp
         assert "timestamp_iso" in event_dict
     
+    def test_timestamp_formatting_reused(self):
+        """Test events sharing a timestamp reuse the formatted string."""
+        first = LogEvent(level=LogLevel.INFO, message="First", timestamp=1600000000.0)
+        second = LogEvent(level=LogLevel.INFO, message="Second", timestamp=1600000000.0)
+        later = LogEvent(level=LogLevel.INFO, message="Later", timestamp=1600000001.0)
+        
+        assert first.to_dict()["timestamp_iso"] is second.to_dict()["timestamp_iso"]
+        assert later.to_dict()["timestamp_iso"] != first.to_dict()["timestamp_iso"]
+        assert later.to_str("{timestamp}") != first.to_str("{timestamp}")
+    
     def test_to_str(self):
         """Test string formatting."""
         timestamp = 1600000000.0  # 2020-09-13 12:26:40
@@ -193,6 +184,12 @@ class TestLogEvent:
         formatted = event.to_str(custom_format)
         assert "test_service.test_component" in formatted
         assert "ERROR: Error message" in formatted
+        
+        # Context values are available as fields
+        event.context["request_id"] = "abc123"
+        assert event.to_str("{request_id} {module}") == "abc123 unknown"
+        with pytest.raises(KeyError):
+            event.to_str("{missing_field}")
 
 
 class TestLogManager:
@@ -238,38 +235,33 @@ class TestLogManager:
         assert manager.log_format == "[{level}] {message}"
         assert manager.date_format == "%H:%M:%S"
     
-    @pytest.mark.asyncio
-    async def test_should_log(self, log_manager):
-        """Test log level filtering."""
+    @pytest.mark.parametrize("threshold,level,expected", [
         # VERBOSE level should filter nothing
-        log_manager.log_level = LogLevel.VERBOSE
-        assert log_manager._should_log(LogLevel.VERBOSE)
-        assert log_manager._should_log(LogLevel.INFO)
-        assert log_manager._should_log(LogLevel.WARNING)
-        assert log_manager._should_log(LogLevel.ERROR)
-        
+        (LogLevel.VERBOSE, LogLevel.VERBOSE, True),
+        (LogLevel.VERBOSE, LogLevel.INFO, True),
+        (LogLevel.VERBOSE, LogLevel.WARNING, True),
+        (LogLevel.VERBOSE, LogLevel.ERROR, True),
         # INFO level should filter VERBOSE
-        log_manager.log_level = LogLevel.INFO
-        assert not log_manager._should_log(LogLevel.VERBOSE)
-        assert log_manager._should_log(LogLevel.INFO)
-        assert log_manager._should_log(LogLevel.WARNING)
-        assert log_manager._should_log(LogLevel.ERROR)
-        
+        (LogLevel.INFO, LogLevel.VERBOSE, False),
+        (LogLevel.INFO, LogLevel.INFO, True),
+        (LogLevel.INFO, LogLevel.WARNING, True),
+        (LogLevel.INFO, LogLevel.ERROR, True),
         # WARNING level should filter VERBOSE and INFO
-        log_manager.log_level = LogLevel.WARNING
-        assert not log_manager._should_log(LogLevel.VERBOSE)
-        assert not log_manager._should_log(LogLevel.INFO)
-        assert log_manager._should_log(LogLevel.WARNING)
-        assert log_manager._should_log(LogLevel.ERROR)
-        
+        (LogLevel.WARNING, LogLevel.VERBOSE, False),
+        (LogLevel.WARNING, LogLevel.INFO, False),
+        (LogLevel.WARNING, LogLevel.WARNING, True),
+        (LogLevel.WARNING, LogLevel.ERROR, True),
         # ERROR level should filter all but ERROR
-        log_manager.log_level = LogLevel.ERROR
-        assert not log_manager._should_log(LogLevel.VERBOSE)
-        assert not log_manager._should_log(LogLevel.INFO)
-        assert not log_manager._should_log(LogLevel.WARNING)
-        assert log_manager._should_log(LogLevel.ERROR)
+        (LogLevel.ERROR, LogLevel.VERBOSE, False),
+        (LogLevel.ERROR, LogLevel.INFO, False),
+        (LogLevel.ERROR, LogLevel.WARNING, False),
+        (LogLevel.ERROR, LogLevel.ERROR, True),
+    ])
+    def test_should_log(self, threshold, level, expected):
+        """Test log level filtering."""
+        manager = LogManager(log_level=threshold, console_output=False)
+        assert manager._should_log(level) is expected
     
-    @pytest.mark.asyncio
     async def test_log_methods(self, log_manager):
         """Test convenience log methods."""
         with CaptureOutput() as output:
@@ -278,8 +270,8 @@ class TestLogManager:
             await log_manager.warning("Warning message", "test_component")
             await log_manager.error("Error message", "test_component")
             
-            # Need to wait for the logs to be processed
-            await asyncio.sleep(0.2)
+            # Wait for the queued logs to be written
+            await log_manager.drain()
             
             captured = output.get_output()
             assert "Verbose message" in captured
@@ -288,7 +280,135 @@ class TestLogManager:
             assert "Error message" in captured
             assert "[test_component]" in captured
     
-    @pytest.mark.asyncio
+    async def test_deferred_message(self, temp_log_dir):
+        """Test callable messages are only built when the level is enabled."""
+        manager = LogManager(
+            service_name="deferred_test",
+            log_level=LogLevel.WARNING,
+            log_dir=temp_log_dir,
+            console_output=False
+        )
+        build = mock.Mock(return_value="Deferred message")
+        
+        await manager.info(build)
+        build.assert_not_called()
+        assert manager.low_priority_queue.empty()
+        
+        await manager.warning(build)
+        build.assert_called_once_with()
+        assert manager.high_priority_queue.get_nowait().message == "Deferred message"
+    
+    async def test_info_many(self, temp_log_dir):
+        """Test logging a batch of messages in one call."""
+        manager = LogManager(
+            service_name="batch_test",
+            log_level=LogLevel.INFO,
+            log_dir=temp_log_dir,
+            console_output=False
+        )
+        
+        await manager.info_many(["First", lambda: "Second"], "batch_component")
+        assert manager.low_priority_queue.qsize() == 2
+        
+        events = [manager.low_priority_queue.get_nowait() for _ in range(2)]
+        assert [event.message for event in events] == ["First", "Second"]
+        assert all(event.component == "batch_component" for event in events)
+        
+        manager.log_level = LogLevel.WARNING
+        await manager.info_many(["Filtered"])
+        assert manager.low_priority_queue.empty()
+    
+    async def test_reset(self, temp_log_dir):
+        """Test resetting queued events, the log file and the log level."""
+        manager = LogManager(
+            service_name="reset_test",
+            log_level=LogLevel.INFO,
+            log_dir=temp_log_dir,
+            console_output=False
+        )
+        manager.log_file.write_text("stale entry\n")
+        
+        manager.log_level = LogLevel.VERBOSE
+        await manager.verbose("Queued message")
+        await manager.error("Queued error")
+        
+        manager.reset()
+        
+        assert manager.low_priority_queue.empty()
+        assert manager.high_priority_queue.empty()
+        assert manager.log_file.read_text() == ""
+        assert manager.log_level == LogLevel.INFO
+    
+    async def test_exception_traceback_reused(self, temp_log_dir):
+        """Test logging the same exception twice formats its traceback once."""
+        manager = LogManager(
+            service_name="exception_test",
+            log_dir=temp_log_dir,
+            console_output=False
+        )
+        
+        try:
+            1 / 0
+        except ZeroDivisionError as e:
+            exception = e
+        
+        await manager.exception(exception)
+        await manager.exception(exception, "Logged again")
+        
+        first = manager.high_priority_queue.get_nowait()
+        second = manager.high_priority_queue.get_nowait()
+        assert "ZeroDivisionError" in first.context["traceback"]
+        assert second.context["traceback"] is first.context["traceback"]
+        
+        # The logged exception is left untouched
+        pickle.loads(pickle.dumps(exception))
+    
+    async def test_exception_unhashable(self, temp_log_dir):
+        """Test logging an exception that defines __eq__ without __hash__."""
+        class UnhashableError(Exception):
+            def __eq__(self, other):
+                return self is other
+        
+        manager = LogManager(
+            service_name="exception_test",
+            log_dir=temp_log_dir,
+            console_output=False
+        )
+        
+        try:
+            raise UnhashableError("boom")
+        except UnhashableError as e:
+            await manager.exception(e)
+        
+        event = manager.high_priority_queue.get_nowait()
+        assert "UnhashableError: boom" in event.context["traceback"]
+    
+    async def test_writes_off_event_loop(self, temp_log_dir):
+        """Test log output is written on the writer thread, not the loop."""
+        manager = LogManager(
+            service_name="writer_test",
+            log_dir=temp_log_dir,
+            console_output=False
+        )
+        await manager.start()
+        
+        threads = []
+        write_outputs = manager._write_outputs
+        
+        def record_thread(data):
+            threads.append(threading.current_thread())
+            write_outputs(data)
+        
+        with mock.patch.object(manager, "_write_outputs", side_effect=record_thread):
+            await manager.info("Threaded message")
+            await manager.drain()
+        await manager.stop()
+        
+        assert threads
+        assert threading.main_thread() not in threads
+        assert "Threaded message" in manager.log_file.read_text()
+        assert manager._writer is None
+    
     async def test_json_format(self, temp_log_dir):
         """Test JSON formatted logs."""
         # Create a log manager with JSON format
@@ -302,12 +422,14 @@ class TestLogManager:
         )
         
         await manager.start()
+        # Write the startup message before capturing
+        await manager.drain()
         
         with CaptureOutput() as output:
             await manager.info("JSON test message", "json_component")
             
-            # Need to wait for the logs to be processed
-            await asyncio.sleep(0.2)
+            # Wait for the queued logs to be written
+            await manager.drain()
             
             await manager.stop()
             
@@ -322,7 +444,6 @@ class TestLogManager:
             except json.JSONDecodeError:
                 pytest.fail("JSON log output is not valid JSON")
     
-    @pytest.mark.asyncio
     async def test_file_logging(self, temp_log_dir):
         """Test logging to a file."""
         # Create a log manager with file output but no console output
@@ -341,8 +462,8 @@ class TestLogManager:
         await manager.info("File test message", "file_component")
         await manager.warning("File warning message", "file_component")
         
-        # Need to wait for the logs to be processed
-        await asyncio.sleep(0.2)
+        # Wait for the queued logs to be written
+        await manager.drain()
         
         await manager.stop()
         
@@ -355,9 +476,31 @@ class TestLogManager:
         assert "File warning message" in log_content
         assert "[file_component]" in log_content
     
-    @pytest.mark.asyncio
-    async def test_log_rotation(self, temp_log_dir):
-        """Test log file rotation."""
+    async def test_log_rotation_minimal(self, temp_log_dir):
+        """Test a log file over its size limit is rotated."""
+        manager = LogManager(
+            service_name="minimal_rotation",
+            log_level=LogLevel.INFO,
+            log_dir=temp_log_dir,
+            max_size=60,
+            backup_count=2,
+            console_output=False
+        )
+        
+        await manager.start()
+        await asyncio.gather(*(manager.info(f"Message {i}") for i in range(3)))
+        await manager.drain()
+        await manager.stop()
+        
+        # Batching differs between Python versions, so count at least one
+        archive_dir = temp_log_dir / "archive"
+        backup_files = list(archive_dir.glob("minimal_rotation*.log"))
+        assert len(backup_files) >= 1
+        assert "Message " in (archive_dir / "minimal_rotation.1.log").read_text()
+    
+    @pytest.mark.slow
+    async def test_log_rotation_heavy(self, temp_log_dir):
+        """Test log file rotation under a burst of messages."""
         # Create a log manager with a very small max size to trigger rotation
         manager = LogManager(
             service_name="rotation_test",
@@ -373,11 +516,17 @@ class TestLogManager:
         await manager.start()
         
         # Log enough messages to trigger rotation
-        for i in range(20):
-            await manager.info(f"This is log message {i} that will fill up the log file quickly", "rotation_test")
-        
-        # Need to wait for the logs to be processed
-        await asyncio.sleep(1.0)
+        # Messages may be passed as callables so formatting is skipped when filtered
+        await asyncio.gather(*(
+            manager.info(
+                lambda i=i: f"This is log message {i} that will fill up the log file quickly",
+                "rotation_test"
+            )
+            for i in range(20)
+        ))
+        
+        # Wait for the queued logs to be written
+        await manager.drain()
         
         await manager.stop()
         
@@ -396,7 +545,6 @@ class TestLogManager:
 class TestComponentLogger:
     """Test cases for ComponentLogger class."""
     
-    @pytest.mark.asyncio
     async def test_component_logger(self, log_manager):
         """Test component logger initialization and usage."""
         # Get a component logger
@@ -410,15 +558,14 @@ class TestComponentLogger:
             await component_logger.info("Component info message")
             await component_logger.warning("Component warning message")
             
-            # Need to wait for the logs to be processed
-            await asyncio.sleep(0.2)
+            # Wait for the queued logs to be written
+            await log_manager.drain()
             
             captured = output.get_output()
             assert "Component info message" in captured
             assert "Component warning message" in captured
             assert "[test_component]" in captured
     
-    @pytest.mark.asyncio
     async def test_component_logger_level_filtering(self, log_manager):
         """Test component logger respects log level filtering."""
         # Set log manager to WARNING level
@@ -436,8 +583,8 @@ class TestComponentLogger:
             await component_logger.warning("Component warning message")
             await component_logger.error("Component error message")
             
-            # Need to wait for the logs to be processed
-            await asyncio.sleep(0.2)
+            # Wait for the queued logs to be written
+            await log_manager.drain()
             
             captured = output.get_output()
             assert "Component verbose message" not in captured
@@ -445,7 +592,6 @@ class TestComponentLogger:
             assert "Component warning message" in captured
             assert "Component error message" in captured
     
-    @pytest.mark.asyncio
     async def test_component_logger_exception(self, log_manager):
         """Test logging exceptions with component logger."""
         # Get a component logger
@@ -460,8 +606,8 @@ class TestComponentLogger:
         with CaptureOutput() as output:
             await component_logger.exception(exception, "Exception occurred")
             
-            # Need to wait for the logs to be processed
-            await asyncio.sleep(0.2)
+            # Wait for the queued logs to be written
+            await log_manager.drain()
             
             captured = output.get_output()
             assert "Exception occurred: division by zero" in captured
@@ -472,7 +618,6 @@ class TestComponentLogger:
 class TestHelperFunctions:
     """Test cases for helper functions in log_manager.py."""
     
-    @pytest.mark.asyncio
     async def test_create_log_manager(self, temp_log_dir):
         """Test create_log_manager factory function."""
         # Create a log manager with the helper function
@@ -496,7 +641,6 @@ class TestHelperFunctions:
         await manager.start()
         await manager.stop()
     
-    @pytest.mark.asyncio
     async def test_get_component_logger_helper(self, log_manager):
         """Test get_component_logger factory function."""
         # Use the helper function to get a component logger
@@ -509,8 +653,8 @@ class TestHelperFunctions:
         with CaptureOutput() as output:
             await component_logger.info("Helper component message")
             
-            # Need to wait for the logs to be processed
-            await asyncio.sleep(0.2)
+            # Wait for the queued logs to be written
+            await log_manager.drain()
             
             captured = output.get_output()
             assert "Helper component message" in captured
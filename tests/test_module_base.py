@@ -11,30 +11,28 @@ These tests verify the proper operation of:
 """
 
 import asyncio
+import copy
 import json
-import os
-import sys
-import tempfile
-from pathlib import Path
 from typing import Dict, Any, Set, Optional
 from unittest import mock
 
 import pytest
 
-# Add parent directory to sys.path to allow importing the framework
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-try:
-    from python_module_framework import (
-        BaseModule, BaseComponent, LogLevel, ConfigParam, Dependency,
-        ModuleError, ConfigError, DependencyError, OperationError, Validator
-    )
-except ImportError:
-    # Try direct import for development
-    from module_base import (
-        BaseModule, BaseComponent, LogLevel, ConfigParam, Dependency,
-        ModuleError, ConfigError, DependencyError, OperationError, Validator
-    )
+from python_module_framework.module_base import (
+    BaseModule,
+    BaseComponent,
+    LogLevel,
+    ConfigParam,
+    Dependency,
+    ModuleError,
+    ConfigError,
+    DependencyError,
+    OperationError,
+    Validator,
+    run_module,
+    load_config_from_file,
+    find_config_file,
+)
 
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
 # Test Classes
@@ -89,10 +87,19 @@ class TestDependency:
         self.data.update(data)
         return True
 
+class _ModuleStub:
+    """Module stand-in with mocked lifecycle methods."""
+    
+    def __init__(self):
+        self.init = mock.AsyncMock()
+        self.run = mock.AsyncMock()
+        self.stop = mock.AsyncMock()
+        self.cleanup = mock.AsyncMock()
+
 class TestModule(BaseModule):
     """Test module for test cases."""
     
-    CONFIG_PARAMS = [
+    CONFIG_PARAMS = (
         ConfigParam(
             name="test_param",
             default="default_value",
@@ -109,10 +116,10 @@ class TestModule(BaseModule):
             default=None,
             description="Required parameter",
             required=True
-        )
-    ]
+        ),
+    )
     
-    DEPENDENCIES = [
+    DEPENDENCIES = (
         Dependency(
             name="test_dependency",
             description="Test dependency",
@@ -124,8 +131,14 @@ class TestModule(BaseModule):
             description="Optional dependency",
             required=False,
             methods={"process"}
-        )
-    ]
+        ),
+    )
+    
+    # Lifecycle tracking for testing; instances override on change
+    initialized = False
+    run_called = False
+    stop_called = False
+    cleanup_called = False
     
     def __init__(self, config=None, dependencies=None, logger=None, log_level=None):
         """Initialize test module."""
@@ -138,12 +151,6 @@ class TestModule(BaseModule):
         self.components = {
             "test_component": self.test_component
         }
-        
-        # Track initialization for testing
-        self.initialized = False
-        self.run_called = False
-        self.stop_called = False
-        self.cleanup_called = False
     
     async def init(self):
         """Initialize the module."""
@@ -168,18 +175,19 @@ class TestModule(BaseModule):
 class TestComponent(BaseComponent):
     """Test component for test cases."""
     
+    # Lifecycle tracking for testing; instances override on change
+    initialized = False
+    run_called = False
+    stop_called = False
+    cleanup_called = False
+    
+    # Custom state for testing
+    counter = 0
+    
     def __init__(self, name, parent_module):
         """Initialize test component."""
         super().__init__(name, parent_module)
-        
-        # Track lifecycle for testing
-        self.initialized = False
-        self.run_called = False
-        self.stop_called = False
-        self.cleanup_called = False
-        
-        # Custom state for testing
-        self.counter = 0
+        self._step = asyncio.Event()
     
     async def init(self):
         """Initialize the component."""
@@ -188,14 +196,16 @@ class TestComponent(BaseComponent):
     
     async def run(self):
         """Run the component."""
-        await super().run()
+        # Replaces the base loop, which would block until the module stops
         self.run_called = True
         
         # Simulate some activity
         try:
             while self.parent.running:
+                # Advance one tick each time the test sets the step event
+                await self._step.wait()
+                self._step.clear()
                 self.counter += 1
-                await asyncio.sleep(0.01)  # Short sleep for tests
         except asyncio.CancelledError:
             pass
     
@@ -209,568 +219,715 @@ class TestComponent(BaseComponent):
         await super().cleanup()
         self.cleanup_called = True
 
+class _HandshakeComponent(BaseComponent):
+    """Component whose init and cleanup wait for a peer to reach the same step."""
+    
+    def __init__(self, name, parent_module, mine, peer):
+        """Initialize with this component's event and its peer's."""
+        super().__init__(name, parent_module)
+        self.mine = mine
+        self.peer = peer
+    
+    async def init(self):
+        """Signal readiness, then wait for the peer."""
+        self.mine.set()
+        await self.peer.wait()
+    
+    async def cleanup(self):
+        """Fail so the module has to log the error."""
+        raise RuntimeError("cleanup failed")
+
+class _FailingComponent(BaseComponent):
+    """Component whose init fails."""
+    
+    async def init(self):
+        """Fail before finishing initialization."""
+        raise RuntimeError("init failed")
+
+class _SlowComponent(BaseComponent):
+    """Component whose init takes several event loop iterations."""
+    
+    initialized = False
+    
+    async def init(self):
+        """Yield a few times, then record initialization."""
+        for _ in range(5):
+            await asyncio.sleep(0)
+        self.initialized = True
+
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
-# Test Cases
+# Fixtures
 #-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
 
-class TestLogLevel:
-    """Test cases for LogLevel enum."""
-    
-    def test_log_level_values(self):
-        """Test that log levels have correct values."""
-        assert LogLevel.VERBOSE == "VERBOSE"
-        assert LogLevel.INFO == "INFO"
-        assert LogLevel.WARNING == "WARNING"
-        assert LogLevel.ERROR == "ERROR"
-    
-    def test_from_string(self):
-        """Test conversion from string to LogLevel."""
-        assert LogLevel.from_string("VERBOSE") == LogLevel.VERBOSE
-        assert LogLevel.from_string("verbose") == LogLevel.VERBOSE
-        assert LogLevel.from_string("INFO") == LogLevel.INFO
-        assert LogLevel.from_string("warning") == LogLevel.WARNING
-        assert LogLevel.from_string("ERROR") == LogLevel.ERROR
-        
-        # Invalid values should default to INFO
-        assert LogLevel.from_string("invalid") == LogLevel.INFO
-        assert LogLevel.from_string("") == LogLevel.INFO
-        assert LogLevel.from_string(None) == LogLevel.INFO
-    
-    def test_default(self):
-        """Test default log level."""
-        assert LogLevel.default() == LogLevel.INFO
-
-class TestConfigParam:
-    """Test cases for ConfigParam class."""
-    
-    def test_init(self):
-        """Test initialization and defaults."""
-        param = ConfigParam(
-            name="test",
-            default="default",
-            description="Test parameter"
-        )
-        
-        assert param.name == "test"
-        assert param.default == "default"
-        assert param.description == "Test parameter"
-        assert param.type == str  # Inferred from default
-        assert not param.required
-        assert param.validators == []
-    
-    def test_validate_success(self):
-        """Test successful validation."""
-        param = ConfigParam(
-            name="test_num",
-            default=10,
-            description="Test number",
-            validators=[Validator.positive]
-        )
-        
-        # Test with valid values
-        assert param.validate(20) == 20
-        assert param.validate("30") == 30  # Type conversion
-        
-        # Test default value
-        assert param.validate(None) == 10
-    
-    def test_validate_failure(self):
-        """Test validation failures."""
-        param = ConfigParam(
-            name="test_num",
-            default=10,
-            description="Test number",
-            validators=[Validator.positive],
-            required=True
-        )
-        
-        # Test required parameter
-        with pytest.raises(ValueError):
-            param.validate(None)
-        
-        # Test validation failure
-        with pytest.raises(ValueError):
-            param.validate(-5)
-        
-        # Test type conversion failure
-        with pytest.raises(ValueError):
-            param.validate("not_a_number")
-
-class TestDependencyClass:
-    """Test cases for Dependency class."""
-    
-    def test_init(self):
-        """Test initialization and defaults."""
-        dep = Dependency(
-            name="test",
-            description="Test dependency"
-        )
-        
-        assert dep.name == "test"
-        assert dep.description == "Test dependency"
-        assert dep.required is True
-        assert dep.methods == set()
-        assert dep.attributes == set()
-    
-    def test_validate_success(self):
-        """Test successful validation."""
-        dep = Dependency(
-            name="storage",
-            description="Storage service",
-            methods={"save", "load"},
-            attributes={"version"}
-        )
+@pytest.fixture
+def fast_sleep(monkeypatch):
+    """Make asyncio.sleep yield to the event loop without waiting."""
+    real_sleep = asyncio.sleep
+    
+    async def _sleep(delay, result=None):
+        return await real_sleep(0, result)
+    
+    monkeypatch.setattr(asyncio, "sleep", _sleep)
+
+@pytest.fixture(scope="session")
+def shared_dependency():
+    """Provide one TestDependency for the session."""
+    return TestDependency()
+
+@pytest.fixture
+def deps(shared_dependency):
+    """Provide the dependencies dict with the shared dependency reset."""
+    shared_dependency.data.clear()
+    shared_dependency.calls.clear()
+    return {"test_dependency": shared_dependency}
+
+@pytest.fixture(scope="session")
+def _module_prototype(shared_dependency):
+    """Build and validate one fully configured TestModule for the session."""
+    return TestModule(
+        config={"required_param": "value"},
+        dependencies={"test_dependency": shared_dependency},
+        logger=MockLogger()
+    )
+
+@pytest.fixture
+def module(_module_prototype):
+    """Provide a fresh TestModule copied from the session prototype."""
+    module = copy.copy(_module_prototype)
+    module.logger = MockLogger()
+    
+    # Give the copy its own component wired to the copy
+    module.test_component = copy.copy(_module_prototype.test_component)
+    module.test_component.parent = module
+    module.test_component.logger = module.logger
+    module.test_component._step = asyncio.Event()
+    module.components = {"test_component": module.test_component}
+    return module
+
+#-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
+# LogLevel Tests
+#-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
+
+def test_log_level_values():
+    """Test that log levels have correct values."""
+    assert LogLevel.VERBOSE == "VERBOSE"
+    assert LogLevel.INFO == "INFO"
+    assert LogLevel.WARNING == "WARNING"
+    assert LogLevel.ERROR == "ERROR"
+
+@pytest.mark.parametrize("level_str,expected", [
+    ("VERBOSE", LogLevel.VERBOSE),
+    ("verbose", LogLevel.VERBOSE),
+    ("INFO", LogLevel.INFO),
+    ("warning", LogLevel.WARNING),
+    ("ERROR", LogLevel.ERROR),
+    # Invalid values should default to INFO
+    ("invalid", LogLevel.INFO),
+    ("", LogLevel.INFO),
+    (None, LogLevel.INFO),
+])
+def test_log_level_from_string(level_str, expected):
+    """Test conversion from string to LogLevel."""
+    assert LogLevel.from_string(level_str) == expected
+
+def test_log_level_default():
+    """Test default log level."""
+    assert LogLevel.default() == LogLevel.INFO
+
+#-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
+# ConfigParam Tests
+#-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
+
+def test_config_param_init():
+    """Test ConfigParam initialization and defaults."""
+    param = ConfigParam(
+        name="test",
+        default="default",
+        description="Test parameter"
+    )
+    
+    assert param.name == "test"
+    assert param.default == "default"
+    assert param.description == "Test parameter"
+    assert param.type == str  # Inferred from default
+    assert not param.required
+    assert param.validators == []
+
+def test_config_param_validate_success():
+    """Test successful ConfigParam validation."""
+    param = ConfigParam(
+        name="test_num",
+        default=10,
+        description="Test number",
+        validators=[Validator.positive]
+    )
+    
+    # Test with valid values
+    assert param.validate(20) == 20
+    assert param.validate("30") == 30  # Type conversion
+    
+    # Test default value
+    assert param.validate(None) == 10
+
+def test_config_param_validate_failure():
+    """Test ConfigParam validation failures."""
+    param = ConfigParam(
+        name="test_num",
+        default=10,
+        description="Test number",
+        validators=[Validator.positive],
+        required=True
+    )
+    
+    # Test required parameter
+    with pytest.raises(ValueError):
+        param.validate(None)
+    
+    # Test validation failure
+    with pytest.raises(ValueError):
+        param.validate(-5)
+    
+    # Test type conversion failure
+    with pytest.raises(ValueError):
+        param.validate("not_a_number")
+
+#-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
+# Dependency Tests
+#-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
+
+def test_dependency_init():
+    """Test Dependency initialization and defaults."""
+    dep = Dependency(
+        name="test",
+        description="Test dependency"
+    )
+    
+    assert dep.name == "test"
+    assert dep.description == "Test dependency"
+    assert dep.required is True
+    assert dep.methods == set()
+    assert dep.attributes == set()
+
+def test_dependency_validate_success():
+    """Test successful Dependency validation."""
+    dep = Dependency(
+        name="storage",
+        description="Storage service",
+        methods={"save", "load"},
+        attributes={"version"}
+    )
+    
+    class Storage:
+        version = "1.0"
         
-        class Storage:
-            version = "1.0"
+        def save(self, data):
+            pass
             
-            def save(self, data):
-                pass
-                
-            def load(self, key):
-                pass
-        
-        # Should not raise
-        assert dep.validate(Storage())
-    
-    def test_validate_failure(self):
-        """Test validation failures."""
-        dep = Dependency(
-            name="storage",
-            description="Storage service",
-            methods={"save", "load"},
-            attributes={"version"}
-        )
+        def load(self, key):
+            pass
+    
+    # Should not raise
+    assert dep.validate(Storage())
+
+def test_dependency_validate_failure():
+    """Test Dependency validation failures."""
+    dep = Dependency(
+        name="storage",
+        description="Storage service",
+        methods={"save", "load"},
+        attributes={"version"}
+    )
+    
+    class MissingMethod:
+        version = "1.0"
         
-        class MissingMethod:
-            version = "1.0"
+        def save(self, data):
+            pass
             
-            def save(self, data):
-                pass
-                
-            # load is missing
+        # load is missing
+    
+    class MissingAttribute:
+        # version is missing
         
-        class MissingAttribute:
-            # version is missing
+        def save(self, data):
+            pass
             
-            def save(self, data):
-                pass
-                
-            def load(self, key):
-                pass
-        
-        # Test missing method
-        with pytest.raises(ValueError):
-            dep.validate(MissingMethod())
-        
-        # Test missing attribute
-        with pytest.raises(ValueError):
-            dep.validate(MissingAttribute())
+        def load(self, key):
+            pass
+    
+    # Test missing method
+    with pytest.raises(ValueError):
+        dep.validate(MissingMethod())
+    
+    # Test missing attribute
+    with pytest.raises(ValueError):
+        dep.validate(MissingAttribute())
 
-class TestBaseModule:
-    """Test cases for BaseModule class."""
+def test_dependency_validate_instance_members():
+    """Test Dependency validation of members set on the instance."""
+    dep = Dependency(
+        name="storage",
+        description="Storage service",
+        methods={"save"},
+        attributes={"version"}
+    )
     
-    def test_init_defaults(self):
-        """Test initialization with defaults."""
-        module = TestModule()
-        
-        # Check initialization
-        assert module.module_name == "TestModule"
-        assert "test_component" in module.components
-        
-        # Check default config values
-        assert module.config["test_param"] == "default_value"
-        assert module.config["test_number"] == 42
+    class InstanceMembers:
+        def __init__(self, version=None):
+            if version is not None:
+                self.version = version
+            self.save = lambda data: None
+    
+    # Class lacks both members, so each instance is checked directly
+    assert dep.validate(InstanceMembers("1.0")) is True
+    with pytest.raises(ValueError):
+        dep.validate(InstanceMembers())
+
+def test_dependency_validate_instance_overrides():
+    """Test Dependency validation sees instance overrides of class members."""
+    dep = Dependency(
+        name="storage",
+        description="Storage service",
+        methods={"save"},
+        attributes={"version"}
+    )
+    
+    class Storage:
+        @property
+        def version(self):
+            raise AttributeError("version not loaded")
         
-        # Required param should still have None as default
-        assert module.config["required_param"] is None
-    
-    def test_init_with_config(self):
-        """Test initialization with config dictionary."""
-        config = {
-            "test_param": "custom_value",
-            "test_number": 100,
+        def save(self, data):
+            pass
+    
+    # Property raising AttributeError counts as missing
+    with pytest.raises(ValueError, match="attribute 'version'"):
+        dep.validate(Storage())
+    
+    # Instance attribute shadowing a class method is not callable
+    class ShadowedStorage(Storage):
+        version = "1.0"
+    
+    storage = ShadowedStorage()
+    storage.save = None
+    with pytest.raises(ValueError, match="method 'save'"):
+        dep.validate(storage)
+
+#-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
+# BaseModule Tests
+#-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
+
+def test_module_init_defaults():
+    """Test module initialization with defaults."""
+    module = TestModule()
+    
+    # Check initialization
+    assert module.module_name == "TestModule"
+    assert "test_component" in module.components
+    
+    # Check default config values
+    assert module.config["test_param"] == "default_value"
+    assert module.config["test_number"] == 42
+    
+    # Required param should still have None as default
+    assert module.config["required_param"] is None
+
+def test_module_init_with_config():
+    """Test module initialization with config dictionary."""
+    config = {
+        "test_param": "custom_value",
+        "test_number": 100,
+        "required_param": "provided"
+    }
+    
+    module = TestModule(config=config)
+    
+    # Check custom config values
+    assert module.config["test_param"] == "custom_value"
+    assert module.config["test_number"] == 100
+    assert module.config["required_param"] == "provided"
+
+def test_module_init_with_config_section():
+    """Test module initialization with config section."""
+    config = {
+        "TestModule": {
+            "test_param": "section_value",
+            "test_number": 200,
             "required_param": "provided"
         }
-        
-        module = TestModule(config=config)
-        
-        # Check custom config values
-        assert module.config["test_param"] == "custom_value"
-        assert module.config["test_number"] == 100
-        assert module.config["required_param"] == "provided"
-    
-    def test_init_with_config_section(self):
-        """Test initialization with config section."""
-        config = {
-            "TestModule": {
-                "test_param": "section_value",
-                "test_number": 200,
-                "required_param": "provided"
-            }
-        }
-        
-        module = TestModule(config=config, module_id="TestModule")
-        
-        # Check config values from section
-        assert module.config["test_param"] == "section_value"
-        assert module.config["test_number"] == 200
-        assert module.config["required_param"] == "provided"
-    
-    def test_init_with_logger(self):
-        """Test initialization with custom logger."""
-        logger = MockLogger()
-        module = TestModule(logger=logger)
-        
-        # Check logger was set
-        assert module.logger is logger
-    
-    def test_dependency_validation(self):
-        """Test dependency validation."""
-        # Missing required dependency
-        with pytest.raises(DependencyError):
-            TestModule(dependencies={})
-        
-        # Valid dependencies
-        dependencies = {
-            "test_dependency": TestDependency()
-        }
-        
-        module = TestModule(
-            config={"required_param": "value"}, 
-            dependencies=dependencies
-        )
-        
-        # Check dependency was stored
-        assert module.dependencies["test_dependency"] is dependencies["test_dependency"]
-    
-    @pytest.mark.asyncio
-    async def test_lifecycle(self):
-        """Test complete module lifecycle."""
-        logger = MockLogger()
-        module = TestModule(
-            config={"required_param": "value"},
-            dependencies={"test_dependency": TestDependency()},
-            logger=logger
-        )
-        
-        # Check initial state
-        assert not module.initialized
-        assert not module.run_called
-        assert not module.stop_called
-        assert not module.cleanup_called
-        
-        # Run lifecycle
+    }
+    
+    module = TestModule(config=config, module_id="TestModule")
+    
+    # Check config values from section
+    assert module.config["test_param"] == "section_value"
+    assert module.config["test_number"] == 200
+    assert module.config["required_param"] == "provided"
+
+def test_module_init_with_logger():
+    """Test module initialization with custom logger."""
+    logger = MockLogger()
+    module = TestModule(logger=logger)
+    
+    # Check logger was set
+    assert module.logger is logger
+
+def test_module_dependency_validation(deps):
+    """Test dependency validation."""
+    # Missing required dependency
+    with pytest.raises(DependencyError):
+        TestModule(dependencies={})
+    
+    # Valid dependencies
+    module = TestModule(
+        config={"required_param": "value"}, 
+        dependencies=deps
+    )
+    
+    # Check dependency was stored
+    assert module.dependencies["test_dependency"] is deps["test_dependency"]
+
+async def test_module_concurrent_lifecycle(module):
+    """Test components initialize and clean up concurrently when enabled."""
+    first, second = asyncio.Event(), asyncio.Event()
+    module.components = {
+        "first": _HandshakeComponent("first", module, first, second),
+        "second": _HandshakeComponent("second", module, second, first),
+    }
+    module.CONCURRENT_LIFECYCLE = True
+    
+    # Sequential init would wait forever on the second component
+    await asyncio.wait_for(module.init(), timeout=1)
+    
+    # Cleanup errors are logged per component, not raised
+    await module.cleanup()
+    errors = [message for level, message in module.logger.logs if level == LogLevel.ERROR]
+    assert sorted(errors) == [
+        "Error cleaning up component first: cleanup failed",
+        "Error cleaning up component second: cleanup failed",
+    ]
+
+async def test_module_concurrent_init_failure(module):
+    """Test a failing concurrent init waits for the other components."""
+    slow = _SlowComponent("slow", module)
+    module.components = {
+        "failing": _FailingComponent("failing", module),
+        "slow": slow,
+    }
+    module.CONCURRENT_LIFECYCLE = True
+    
+    with pytest.raises(RuntimeError, match="init failed"):
         await module.init()
-        assert module.initialized
-        assert module.test_component.initialized
-        
-        # Start running for a short time
-        module.running = True
-        run_task = asyncio.create_task(module.run())
-        
-        # Let it run briefly
-        await asyncio.sleep(0.05)
-        
-        # Stop and cleanup
-        await module.stop()
-        await module.cleanup()
-        await run_task
-        
-        # Check final state
-        assert module.initialized
-        assert module.run_called
-        assert module.stop_called
-        assert module.cleanup_called
-        
-        # Check component lifecycle
-        assert module.test_component.initialized
-        assert module.test_component.run_called
-        assert module.test_component.stop_called
-        assert module.test_component.cleanup_called
-        
-        # Component should have run for a bit
-        assert module.test_component.counter > 0
-    
-    @pytest.mark.asyncio
-    async def test_logging(self):
-        """Test module logging."""
-        logger = MockLogger()
-        module = TestModule(
-            config={"required_param": "value"},
-            dependencies={"test_dependency": TestDependency()},
-            logger=logger
-        )
-        
-        # Log messages at different levels
-        await module._log(LogLevel.VERBOSE, "Verbose message")
-        await module._log(LogLevel.INFO, "Info message")
-        await module._log(LogLevel.WARNING, "Warning message")
-        await module._log(LogLevel.ERROR, "Error message")
-        
-        # Check log messages
-        assert len(logger.logs) == 4
-        assert logger.logs[0] == (LogLevel.VERBOSE, "Verbose message")
-        assert logger.logs[1] == (LogLevel.INFO, "Info message")
-        assert logger.logs[2] == (LogLevel.WARNING, "Warning message")
-        assert logger.logs[3] == (LogLevel.ERROR, "Error message")
-
-class TestBaseComponent:
-    """Test cases for BaseComponent class."""
-    
-    @pytest.mark.asyncio
-    async def test_component_lifecycle(self):
-        """Test component lifecycle."""
-        logger = MockLogger()
-        module = TestModule(
-            config={"required_param": "value"},
-            dependencies={"test_dependency": TestDependency()},
-            logger=logger
-        )
-        
-        component = module.test_component
-        
-        # Check initial state
-        assert not component.initialized
-        assert not component.run_called
-        assert not component.stop_called
-        assert not component.cleanup_called
-        
-        # Run lifecycle
-        await component.init()
-        assert component.initialized
-        
-        # Start running
-        module.running = True
-        run_task = asyncio.create_task(component.run())
-        
-        # Let it run briefly
-        await asyncio.sleep(0.05)
-        
-        # Stop and cleanup
-        module.running = False
-        await component.stop()
-        await component.cleanup()
-        await run_task
-        
-        # Check final state
-        assert component.initialized
-        assert component.run_called
-        assert component.stop_called
-        assert component.cleanup_called
-        
-        # Component should have run for a bit
-        assert component.counter > 0
-    
-    @pytest.mark.asyncio
-    async def test_component_logging(self):
-        """Test component logging."""
-        logger = MockLogger()
-        module = TestModule(
-            config={"required_param": "value"},
-            dependencies={"test_dependency": TestDependency()},
-            logger=logger
-        )
-        
-        component = module.test_component
-        
-        # Log messages at different levels
-        await component._log(LogLevel.VERBOSE, "Component verbose message")
-        await component._log(LogLevel.INFO, "Component info message")
-        await component._log(LogLevel.WARNING, "Component warning message")
-        await component._log(LogLevel.ERROR, "Component error message")
-        
-        # Check log messages
-        assert len(logger.logs) == 4
-        assert logger.logs[0] == (LogLevel.VERBOSE, "[test_component] Component verbose message")
-        assert logger.logs[1] == (LogLevel.INFO, "[test_component] Component info message")
-        assert logger.logs[2] == (LogLevel.WARNING, "[test_component] Component warning message")
-        assert logger.logs[3] == (LogLevel.ERROR, "[test_component] Component error message")
-
-class TestValidators:
-    """Test cases for validator functions."""
-    
-    def test_positive(self):
-        """Test positive validator."""
-        assert Validator.positive(1)
-        assert Validator.positive(0.1)
-        assert not Validator.positive(0)
-        assert not Validator.positive(-1)
-    
-    def test_non_negative(self):
-        """Test non_negative validator."""
-        assert Validator.non_negative(1)
-        assert Validator.non_negative(0)
-        assert not Validator.non_negative(-1)
-    
-    def test_port_number(self):
-        """Test port_number validator."""
-        assert Validator.port_number(1024)
-        assert Validator.port_number(8080)
-        assert Validator.port_number(65535)
-        assert not Validator.port_number(0)
-        assert not Validator.port_number(65536)
-        assert not Validator.port_number("8080")  # Must be int
-    
-    def test_in_range(self):
-        """Test in_range validator."""
-        validator = Validator.in_range(1, 10)
-        assert validator(1)
-        assert validator(5)
-        assert validator(10)
-        assert not validator(0)
-        assert not validator(11)
-    
-    def test_one_of(self):
-        """Test one_of validator."""
-        validator = Validator.one_of(["a", "b", "c"])
-        assert validator("a")
-        assert validator("b")
-        assert validator("c")
-        assert not validator("d")
-    
-    def test_matches(self):
-        """Test matches validator."""
-        validator = Validator.matches(r"^[0-9]{3}-[0-9]{3}$")
-        assert validator("123-456")
-        assert not validator("12-345")
-        assert not validator("123-4567")
-        assert not validator("abc-def")
-    
-    def test_ip_address(self):
-        """Test ip_address validator."""
-        assert Validator.ip_address("192.168.1.1")
-        assert Validator.ip_address("10.0.0.1")
-        assert Validator.ip_address("127.0.0.1")
-        assert not Validator.ip_address("256.256.256.256")
-        assert not Validator.ip_address("1.2.3")
-        assert not Validator.ip_address("hostname")
-    
-    def test_hostname(self):
-        """Test hostname validator."""
-        assert Validator.hostname("example.com")
-        assert Validator.hostname("sub.example.com")
-        assert Validator.hostname("localhost")
-        assert not Validator.hostname("example..com")
-        assert not Validator.hostname("-example.com")
-    
-    def test_email(self):
-        """Test email validator."""
-        assert Validator.email("user@example.com")
-        assert Validator.email("user.name@example.co.uk")
-        assert not Validator.email("user@")
-        assert not Validator.email("@example.com")
-        assert not Validator.email("user@example")
-    
-    def test_url(self):
-        """Test url validator."""
-        assert Validator.url("http://example.com")
-        assert Validator.url("https://sub.example.com/path")
-        assert not Validator.url("example.com")
-        assert not Validator.url("http://")
-    
-    def test_length(self):
-        """Test length validator."""
-        min_validator = Validator.length(min_len=3)
-        assert min_validator("abc")
-        assert min_validator("abcdef")
-        assert not min_validator("ab")
-        
-        range_validator = Validator.length(min_len=3, max_len=6)
-        assert range_validator("abc")
-        assert range_validator("abcdef")
-        assert not range_validator("ab")
-        assert not range_validator("abcdefg")
-
-class TestHelperFunctions:
-    """Test cases for helper functions."""
-    
-    @pytest.mark.asyncio
-    async def test_run_module(self):
-        """Test run_module helper function."""
-        from module_base import run_module
-        
-        # Create a module with mocked functions to check call order
-        mock_module = mock.MagicMock(spec=TestModule)
-        mock_module.init = mock.AsyncMock()
-        mock_module.run = mock.AsyncMock()
-        mock_module.stop = mock.AsyncMock()
-        mock_module.cleanup = mock.AsyncMock()
-        
-        # Mock the constructor to return our mock
-        with mock.patch('test_module_base.TestModule', return_value=mock_module):
-            result = await run_module(TestModule, config={"test": "value"})
-            
-            # Check the module was returned
-            assert result is mock_module
-            
-            # Check lifecycle methods were called in correct order
-            mock_module.init.assert_called_once()
-            mock_module.run.assert_called_once()
-            mock_module.stop.assert_called_once()
-            mock_module.cleanup.assert_called_once()
-    
-    def test_load_config_from_file(self):
-        """Test load_config_from_file helper function."""
-        from module_base import load_config_from_file
-        
-        # Create a temporary config file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp:
-            temp.write(json.dumps({"test": "value"}))
-            temp_path = temp.name
-        
-        try:
-            # Load the config
-            config = load_config_from_file(temp_path)
-            assert config == {"test": "value"}
-            
-            # Test with non-existent file
-            with pytest.raises(ConfigError):
-                load_config_from_file("non_existent_file.json")
-                
-            # Test with invalid JSON
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as invalid:
-                invalid.write("not valid json")
-                invalid_path = invalid.name
-                
-            with pytest.raises(ConfigError):
-                load_config_from_file(invalid_path)
-                
-        finally:
-            # Clean up temporary files
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-            if 'invalid_path' in locals() and os.path.exists(invalid_path):
-                os.unlink(invalid_path)
-    
-    def test_find_config_file(self):
-        """Test find_config_file helper function."""
-        from module_base import find_config_file
-        
-        # Create temporary config files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create a common config file
-            common_config = temp_path / "config.json"
-            common_config.write_text(json.dumps({"common": "value"}))
-            
-            # Create a module-specific config file
-            module_config = temp_path / "test_module.json"
-            module_config.write_text(json.dumps({"module": "value"}))
-            
-            # Test finding common config
-            found = find_config_file(search_paths=[temp_path])
-            assert found == common_config
-            
-            # Test finding module-specific config
-            found = find_config_file(module_id="test_module", search_paths=[temp_path])
-            assert found == module_config
-            
-            # Test priority (module-specific should be found first)
-            found = find_config_file(module_id="test_module", file_name="config.json", search_paths=[temp_path])
-            assert found == module_config
-            
-            # Test when no config exists
-            found = find_config_file(module_id="non_existent", search_paths=[temp_path])
-            assert found is None
\ No newline at end of file
+    
+    # The error is raised only after the other init has finished
+    assert slow.initialized
+
+async def test_module_lifecycle(module, fast_sleep):
+    """Test complete module lifecycle."""
+    # Check initial state
+    assert not module.initialized
+    assert not module.run_called
+    assert not module.stop_called
+    assert not module.cleanup_called
+    
+    # Run lifecycle
+    await module.init()
+    assert module.initialized
+    assert module.test_component.initialized
+    
+    # Start running for a short time
+    module.running = True
+    run_task = asyncio.create_task(module.run())
+    
+    # Step the component a few times
+    for _ in range(5):
+        module.test_component._step.set()
+        await asyncio.sleep(0)
+    
+    # Stop and cleanup
+    await module.stop()
+    module.test_component._step.set()
+    await module.cleanup()
+    await run_task
+    
+    # Check final state
+    assert module.initialized
+    assert module.run_called
+    assert module.stop_called
+    assert module.cleanup_called
+    
+    # Check component lifecycle
+    assert module.test_component.initialized
+    assert module.test_component.run_called
+    assert module.test_component.stop_called
+    assert module.test_component.cleanup_called
+    
+    # Component should have run for a bit
+    assert module.test_component.counter > 0
+
+async def test_module_logging(module):
+    """Test module logging."""
+    logger = module.logger
+    
+    # Log messages at different levels
+    await module._log(LogLevel.VERBOSE, "Verbose message")
+    await module._log(LogLevel.INFO, "Info message")
+    await module._log(LogLevel.WARNING, "Warning message")
+    await module._log(LogLevel.ERROR, "Error message")
+    
+    # Check log messages
+    assert logger.logs == [
+        (LogLevel.VERBOSE, "Verbose message"),
+        (LogLevel.INFO, "Info message"),
+        (LogLevel.WARNING, "Warning message"),
+        (LogLevel.ERROR, "Error message"),
+    ]
+
+#-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
+# BaseComponent Tests
+#-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
+
+async def test_component_lifecycle(module):
+    """Test component lifecycle."""
+    component = module.test_component
+    
+    # Check initial state
+    assert not component.initialized
+    assert not component.run_called
+    assert not component.stop_called
+    assert not component.cleanup_called
+    
+    # Run lifecycle
+    await component.init()
+    assert component.initialized
+    
+    # Start running
+    module.running = True
+    run_task = asyncio.create_task(component.run())
+    
+    # Step the component a few times
+    for _ in range(5):
+        component._step.set()
+        await asyncio.sleep(0)
+    
+    # Stop and cleanup
+    module.running = False
+    component._step.set()
+    await component.stop()
+    await component.cleanup()
+    await run_task
+    
+    # Check final state
+    assert component.initialized
+    assert component.run_called
+    assert component.stop_called
+    assert component.cleanup_called
+    
+    # Component should have advanced at least once per step
+    assert component.counter >= 5
+
+async def test_component_logging(module):
+    """Test component logging."""
+    logger = module.logger
+    
+    component = module.test_component
+    
+    # Log messages at different levels
+    await component._log(LogLevel.VERBOSE, "Component verbose message")
+    await component._log(LogLevel.INFO, "Component info message")
+    await component._log(LogLevel.WARNING, "Component warning message")
+    await component._log(LogLevel.ERROR, "Component error message")
+    
+    # Check log messages
+    assert logger.logs == [
+        (LogLevel.VERBOSE, "[test_component] Component verbose message"),
+        (LogLevel.INFO, "[test_component] Component info message"),
+        (LogLevel.WARNING, "[test_component] Component warning message"),
+        (LogLevel.ERROR, "[test_component] Component error message"),
+    ]
+
+#-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
+# Validator Tests
+#-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
+
+def test_validator_positive():
+    """Test positive validator."""
+    assert Validator.positive(1)
+    assert Validator.positive(0.1)
+    assert not Validator.positive(0)
+    assert not Validator.positive(-1)
+
+def test_validator_non_negative():
+    """Test non_negative validator."""
+    assert Validator.non_negative(1)
+    assert Validator.non_negative(0)
+    assert not Validator.non_negative(-1)
+
+@pytest.mark.parametrize("value,expected", [
+    (1024, True),
+    (8080, True),
+    (65535, True),
+    (0, False),
+    (65536, False),
+    ("8080", False),  # Must be int
+])
+def test_validator_port_number(value, expected):
+    """Test port_number validator."""
+    assert Validator.port_number(value) is expected
+
+def test_validator_in_range():
+    """Test in_range validator."""
+    validator = Validator.in_range(1, 10)
+    assert validator(1)
+    assert validator(5)
+    assert validator(10)
+    assert not validator(0)
+    assert not validator(11)
+
+def test_validator_one_of():
+    """Test one_of validator."""
+    validator = Validator.one_of(["a", "b", "c"])
+    assert validator("a")
+    assert validator("b")
+    assert validator("c")
+    assert not validator("d")
+
+def test_validator_matches():
+    """Test matches validator."""
+    validator = Validator.matches(r"^[0-9]{3}-[0-9]{3}$")
+    assert validator("123-456")
+    assert not validator("12-345")
+    assert not validator("123-4567")
+    assert not validator("abc-def")
+
+@pytest.mark.parametrize("value,expected", [
+    ("192.168.1.1", True),
+    ("10.0.0.1", True),
+    ("127.0.0.1", True),
+    ("256.256.256.256", False),
+    ("1.2.3", False),
+    ("hostname", False),
+])
+def test_validator_ip_address(value, expected):
+    """Test ip_address validator."""
+    assert Validator.ip_address(value) is expected
+
+@pytest.mark.parametrize("value,expected", [
+    ("example.com", True),
+    ("sub.example.com", True),
+    ("localhost", True),
+    ("example..com", False),
+    ("-example.com", False),
+])
+def test_validator_hostname(value, expected):
+    """Test hostname validator."""
+    assert Validator.hostname(value) is expected
+
+@pytest.mark.parametrize("value,expected", [
+    ("user@example.com", True),
+    ("user.name@example.co.uk", True),
+    ("user@", False),
+    ("@example.com", False),
+    ("user@example", False),
+])
+def test_validator_email(value, expected):
+    """Test email validator."""
+    assert Validator.email(value) is expected
+
+@pytest.mark.parametrize("value,expected", [
+    ("http://example.com", True),
+    ("https://sub.example.com/path", True),
+    ("example.com", False),
+    ("http://", False),
+])
+def test_validator_url(value, expected):
+    """Test url validator."""
+    assert Validator.url(value) is expected
+
+def test_validator_length():
+    """Test length validator."""
+    min_validator = Validator.length(min_len=3)
+    assert min_validator("abc")
+    assert min_validator("abcdef")
+    assert not min_validator("ab")
+    
+    range_validator = Validator.length(min_len=3, max_len=6)
+    assert range_validator("abc")
+    assert range_validator("abcdef")
+    assert not range_validator("ab")
+    assert not range_validator("abcdefg")
+
+#-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
+# Helper Function Tests
+#-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~-+-~
+
+async def test_run_module():
+    """Test run_module helper function."""
+    # Create a module with mocked functions to check call order
+    mock_module = _ModuleStub()
+    
+    # run_module only calls the class, so a factory can stand in for it
+    constructor_calls = []
+    
+    def module_factory(*args, **kwargs):
+        constructor_calls.append((args, kwargs))
+        return mock_module
+    
+    result = await run_module(module_factory, config={"test": "value"})
+    
+    # Check the module was built and returned
+    assert constructor_calls == [((), {"config": {"test": "value"}})]
+    assert result is mock_module
+    
+    # Check lifecycle methods were called in correct order
+    mock_module.init.assert_called_once()
+    mock_module.run.assert_called_once()
+    mock_module.stop.assert_called_once()
+    mock_module.cleanup.assert_called_once()
+
+def test_load_config_from_file(tmp_path):
+    """Test load_config_from_file helper function."""
+    # Create a temporary config file
+    temp_path = tmp_path / "config.json"
+    temp_path.write_text(json.dumps({"test": "value"}))
+    
+    # Load the config
+    config = load_config_from_file(temp_path)
+    assert config == {"test": "value"}
+    
+    # Test with non-existent file
+    with pytest.raises(ConfigError):
+        load_config_from_file(tmp_path / "missing.json")
+    
+    # Test with invalid JSON
+    invalid_path = tmp_path / "invalid.json"
+    invalid_path.write_text("not valid json")
+    
+    with pytest.raises(ConfigError):
+        load_config_from_file(invalid_path)
+
+def test_find_config_file(tmp_path):
+    """Test find_config_file helper function."""
+    # Create a common config file
+    common_config = tmp_path / "config.json"
+    common_config.write_text(json.dumps({"common": "value"}))
+    
+    # Create a module-specific config file
+    module_config = tmp_path / "test_module.json"
+    module_config.write_text(json.dumps({"module": "value"}))
+    
+    # Test finding common config
+    found = find_config_file(search_paths=[tmp_path])
+    assert found == common_config
+    
+    # Test finding module-specific config
+    found = find_config_file(module_id="test_module", search_paths=[tmp_path])
+    assert found == module_config
+    
+    # Test priority (module-specific should be found first)
+    found = find_config_file(module_id="test_module", file_name="config.json", search_paths=[tmp_path])
+    assert found == module_config
+    
+    # Test when no config exists
+    found = find_config_file(module_id="non_existent", search_paths=[tmp_path])
+    assert found is None